@@ -1,9 +1,16 @@
 """Application settings management."""
 
 import json
+import threading
 from pathlib import Path
-from typing import Optional
-from adaptive_resume.utils.encryption import EncryptionManager
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from adaptive_resume.utils.encryption import EncryptionManager
+
+
+_instance: Optional["Settings"] = None
+_instance_lock = threading.Lock()
 
 
 class Settings:
@@ -21,9 +28,45 @@ class Settings:
     
     def __init__(self):
         """Initialize settings manager."""
-        self.encryption = EncryptionManager()
+        self._encryption: Optional["EncryptionManager"] = None
+        self.settings = self._load_settings()
+    
+    @classmethod
+    def instance(cls) -> "Settings":
+        """
+        Get the process-wide settings instance.
+        
+        The settings file is read once, on first call; use reload() to
+        pick up changes made by another process.
+        
+        Returns:
+            Shared Settings instance
+        """
+        global _instance
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    _instance = cls()
+        return _instance
+    
+    def reload(self):
+        """Re-read settings from file, discarding unsaved changes."""
         self.settings = self._load_settings()
     
+    @property
+    def encryption(self) -> "EncryptionManager":
+        """
+        Encryption manager, created on first use.
+        
+        Reading plain settings never needs the key file or the
+        cryptography package, so both are deferred until a key is
+        stored or read.
+        """
+        if self._encryption is None:
+            from adaptive_resume.utils.encryption import EncryptionManager
+            self._encryption = EncryptionManager()
+        return self._encryption
+    
     def _load_settings(self) -> dict:
         """
         Load settings from file.
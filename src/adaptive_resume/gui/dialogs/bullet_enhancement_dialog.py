@@ -42,7 +42,7 @@ class BulletEnhancementDialog(QDialog):
         super().__init__(parent)
         self.original_text = original_text
         self.enhanced_text = None
-        self.settings = Settings()
+        self.settings = Settings.instance()
         
         self.enhancer = BulletEnhancer()
         self.ai_service = AIEnhancementService()
@@ -6,6 +6,7 @@ AI-powered cover letters tailored to specific job postings.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional
 from pathlib import Path
 
@@ -83,7 +84,7 @@ class CoverLetterEditorDialog(QDialog):
         self.cover_letter = cover_letter
         self.session = DatabaseManager.get_session()
         self.service = CoverLetterGenerationService(self.session)
-        self.settings = Settings()
+        self.settings = Settings.instance()
 
         # Track if content has been generated/modified
         self.is_generated = cover_letter is not None
@@ -281,17 +282,17 @@ class CoverLetterEditorDialog(QDialog):
         layout.addWidget(QLabel("Regenerate:"))
 
         self.regen_opening_btn = QPushButton("Opening")
-        self.regen_opening_btn.clicked.connect(lambda: self._on_regenerate_section("opening"))
+        self.regen_opening_btn.clicked.connect(partial(self._on_regenerate_section, "opening"))
         self.regen_opening_btn.setEnabled(False)
         layout.addWidget(self.regen_opening_btn)
 
         self.regen_body_btn = QPushButton("Body")
-        self.regen_body_btn.clicked.connect(lambda: self._on_regenerate_section("body"))
+        self.regen_body_btn.clicked.connect(partial(self._on_regenerate_section, "body"))
         self.regen_body_btn.setEnabled(False)
         layout.addWidget(self.regen_body_btn)
 
         self.regen_closing_btn = QPushButton("Closing")
-        self.regen_closing_btn.clicked.connect(lambda: self._on_regenerate_section("closing"))
+        self.regen_closing_btn.clicked.connect(partial(self._on_regenerate_section, "closing"))
         self.regen_closing_btn.setEnabled(False)
         layout.addWidget(self.regen_closing_btn)
 
@@ -316,17 +317,17 @@ class CoverLetterEditorDialog(QDialog):
 
         # Export buttons
         self.export_txt_btn = QPushButton("Export as Text")
-        self.export_txt_btn.clicked.connect(lambda: self._on_export("txt"))
+        self.export_txt_btn.clicked.connect(partial(self._on_export, "txt"))
         self.export_txt_btn.setEnabled(False)
         layout.addWidget(self.export_txt_btn)
 
         self.export_html_btn = QPushButton("Export as HTML")
-        self.export_html_btn.clicked.connect(lambda: self._on_export("html"))
+        self.export_html_btn.clicked.connect(partial(self._on_export, "html"))
         self.export_html_btn.setEnabled(False)
         layout.addWidget(self.export_html_btn)
 
         self.export_pdf_btn = QPushButton("Export as PDF")
-        self.export_pdf_btn.clicked.connect(lambda: self._on_export("pdf"))
+        self.export_pdf_btn.clicked.connect(partial(self._on_export, "pdf"))
         self.export_pdf_btn.setEnabled(False)
         layout.addWidget(self.export_pdf_btn)
 
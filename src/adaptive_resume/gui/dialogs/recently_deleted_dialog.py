@@ -61,6 +61,7 @@ class RecentlyDeletedDialog(QDialog):
 
         self.jobs_list = QListWidget()
         self.jobs_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.jobs_list.setUniformItemSizes(True)
         jobs_layout.addWidget(self.jobs_list)
 
         # Jobs buttons
@@ -82,6 +83,7 @@ class RecentlyDeletedDialog(QDialog):
 
         self.bullets_list = QListWidget()
         self.bullets_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.bullets_list.setUniformItemSizes(True)
         bullets_layout.addWidget(self.bullets_list)
 
         # Bullets buttons
@@ -127,12 +129,16 @@ class RecentlyDeletedDialog(QDialog):
             self.restore_job_btn.setEnabled(False)
             self.delete_job_btn.setEnabled(False)
         else:
-            for job in jobs:
-                deleted_date = self._format_datetime(job.deleted_at)
-                text = f"{job.job_title} at {job.company_name} (Deleted: {deleted_date})"
-                item = QListWidgetItem(text)
-                item.setData(Qt.ItemDataRole.UserRole, job.id)
-                self.jobs_list.addItem(item)
+            self.jobs_list.setUpdatesEnabled(False)
+            try:
+                for job in jobs:
+                    deleted_date = self._format_datetime(job.deleted_at)
+                    text = f"{job.job_title} at {job.company_name} (Deleted: {deleted_date})"
+                    item = QListWidgetItem(text)
+                    item.setData(Qt.ItemDataRole.UserRole, job.id)
+                    self.jobs_list.addItem(item)
+            finally:
+                self.jobs_list.setUpdatesEnabled(True)
             self.restore_job_btn.setEnabled(True)
             self.delete_job_btn.setEnabled(True)
 
@@ -153,18 +159,22 @@ class RecentlyDeletedDialog(QDialog):
             self.restore_bullet_btn.setEnabled(False)
             self.delete_bullet_btn.setEnabled(False)
         else:
-            for bullet in bullets:
-                deleted_date = self._format_datetime(bullet.deleted_at)
-                # Show preview of content (first 100 chars)
-                preview = bullet.content[:100] + "..." if len(bullet.content) > 100 else bullet.content
-                # Get job info if available
-                job_info = ""
-                if bullet.job:
-                    job_info = f" [{bullet.job.job_title} at {bullet.job.company_name}]"
-                text = f"{preview}{job_info} (Deleted: {deleted_date})"
-                item = QListWidgetItem(text)
-                item.setData(Qt.ItemDataRole.UserRole, bullet.id)
-                self.bullets_list.addItem(item)
+            self.bullets_list.setUpdatesEnabled(False)
+            try:
+                for bullet in bullets:
+                    deleted_date = self._format_datetime(bullet.deleted_at)
+                    # Show preview of content (first 100 chars)
+                    preview = bullet.content[:100] + "..." if len(bullet.content) > 100 else bullet.content
+                    # Get job info if available
+                    job_info = ""
+                    if bullet.job:
+                        job_info = f" [{bullet.job.job_title} at {bullet.job.company_name}]"
+                    text = f"{preview}{job_info} (Deleted: {deleted_date})"
+                    item = QListWidgetItem(text)
+                    item.setData(Qt.ItemDataRole.UserRole, bullet.id)
+                    self.bullets_list.addItem(item)
+            finally:
+                self.bullets_list.setUpdatesEnabled(True)
             self.restore_bullet_btn.setEnabled(True)
             self.delete_bullet_btn.setEnabled(True)
 
@@ -31,6 +31,23 @@ from adaptive_resume.models.tailored_resume import TailoredResumeModel
 from adaptive_resume.gui.database_manager import DatabaseManager
 
 
+# Stylesheets shared by every dialog instance so Qt sees identical strings.
+_TITLE_CSS = "font-size: 18px; font-weight: bold; margin-bottom: 10px;"
+_SUBTITLE_CSS = "color: #666; margin-bottom: 15px;"
+_FIELD_LABEL_CSS = "font-weight: bold;"
+_SUMMARY_LABEL_CSS = "margin-top: 10px;"
+_PREVIEW_INFO_CSS = "padding: 15px;"
+_PRIMARY_BUTTON_CSS = "font-weight: bold; padding: 8px 16px;"
+
+# Grey hint labels are styled once at the dialog level via object names.
+_HINT_CSS = (
+    "QLabel#variantHint { color: #888; margin-bottom: 10px; }"
+    "QLabel#templateHint { color: #888; margin-top: 10px; padding: 10px; }"
+    "QLabel#tipHint { color: #888; font-size: 11px; padding: 10px; "
+    "background: #1a2332; border-radius: 4px; margin-top: 10px; }"
+)
+
+
 class ResumePDFPreviewDialog(QDialog):
     """Dialog for previewing and exporting resume PDFs.
 
@@ -74,6 +91,7 @@ class ResumePDFPreviewDialog(QDialog):
         self.setWindowTitle("Resume PDF Preview")
         self.setMinimumWidth(700)
         self.setMinimumHeight(600)
+        self.setStyleSheet(_HINT_CSS)
 
         self._build_ui()
         self._load_initial_preview()
@@ -84,13 +102,13 @@ class ResumePDFPreviewDialog(QDialog):
 
         # Title
         title = QLabel("Resume PDF Export")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        title.setStyleSheet(_TITLE_CSS)
         layout.addWidget(title)
 
         # Subtitle
         subtitle = QLabel("Select a template and customize your resume before exporting.")
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet("color: #666; margin-bottom: 15px;")
+        subtitle.setStyleSheet(_SUBTITLE_CSS)
         layout.addWidget(subtitle)
 
         # Variant Selection Section (if multiple variants exist)
@@ -123,7 +141,7 @@ class ResumePDFPreviewDialog(QDialog):
 
         # Export button
         export_button = QPushButton("Export as PDF...")
-        export_button.setStyleSheet("font-weight: bold; padding: 8px 16px;")
+        export_button.setStyleSheet(_PRIMARY_BUTTON_CSS)
         export_button.clicked.connect(self._export_pdf)
         button_layout.addWidget(export_button)
 
@@ -144,13 +162,13 @@ class ResumePDFPreviewDialog(QDialog):
             "Multiple resume variants exist for this job. Select which one to export:"
         )
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: #888; margin-bottom: 10px;")
+        info_label.setObjectName("variantHint")
         layout.addWidget(info_label)
 
         # Variant selector
         selector_layout = QHBoxLayout()
         variant_label = QLabel("Variant:")
-        variant_label.setStyleSheet("font-weight: bold;")
+        variant_label.setStyleSheet(_FIELD_LABEL_CSS)
         selector_layout.addWidget(variant_label)
 
         self.variant_combo = QComboBox()
@@ -187,7 +205,7 @@ class ResumePDFPreviewDialog(QDialog):
         # Template selector
         selector_layout = QHBoxLayout()
         template_label = QLabel("Template:")
-        template_label.setStyleSheet("font-weight: bold;")
+        template_label.setStyleSheet(_FIELD_LABEL_CSS)
         selector_layout.addWidget(template_label)
 
         self.template_combo = QComboBox()
@@ -220,7 +238,7 @@ class ResumePDFPreviewDialog(QDialog):
         # Template description
         self.template_description = QLabel()
         self.template_description.setWordWrap(True)
-        self.template_description.setStyleSheet("color: #888; margin-top: 10px; padding: 10px;")
+        self.template_description.setObjectName("templateHint")
         self._update_template_description()
         layout.addWidget(self.template_description)
 
@@ -240,7 +258,7 @@ class ResumePDFPreviewDialog(QDialog):
 
         # Summary text edit (only visible when checkbox is checked)
         summary_label = QLabel("Summary text:")
-        summary_label.setStyleSheet("margin-top: 10px;")
+        summary_label.setStyleSheet(_SUMMARY_LABEL_CSS)
         layout.addWidget(summary_label)
 
         self.summary_text_edit = QTextEdit()
@@ -266,17 +284,14 @@ class ResumePDFPreviewDialog(QDialog):
 
         self.preview_info_label = QLabel("Generating preview...")
         self.preview_info_label.setWordWrap(True)
-        self.preview_info_label.setStyleSheet("padding: 15px;")
+        self.preview_info_label.setStyleSheet(_PREVIEW_INFO_CSS)
         layout.addWidget(self.preview_info_label)
 
         note_label = QLabel(
             "💡 Tip: Use 'Preview in PDF Viewer' to see the actual PDF before exporting."
         )
         note_label.setWordWrap(True)
-        note_label.setStyleSheet(
-            "color: #888; font-size: 11px; padding: 10px; "
-            "background: #1a2332; border-radius: 4px; margin-top: 10px;"
-        )
+        note_label.setObjectName("tipHint")
         layout.addWidget(note_label)
 
         group.setLayout(layout)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import logging
+from functools import partial
+from typing import Any, Callable, Optional, Sequence
 
 try:
     from PyQt6.QtWidgets import (
@@ -17,14 +19,33 @@ try:
         QGroupBox,
         QScrollArea,
         QWidget,
-        QCheckBox,
+        QListView,
         QMessageBox,
         QProgressDialog,
+        QApplication,
+        QStyle,
+        QStyledItemDelegate,
+        QStyleOptionViewItem,
+        QToolButton,
     )
-    from PyQt6.QtCore import Qt
+    from PyQt6.QtCore import (
+        Qt,
+        QAbstractListModel,
+        QEvent,
+        QModelIndex,
+        QRect,
+        QSize,
+        QThread,
+        QTimer,
+        pyqtSignal,
+    )
+    from PyQt6.QtGui import QColor, QFont, QFontMetrics
 except ImportError as exc:  # pragma: no cover
     raise ImportError("PyQt6 is required to use the GUI components") from exc
 
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
 from adaptive_resume.services import (
     ExtractedResume,
     ResumeImporter,
@@ -32,6 +53,344 @@ from adaptive_resume.services import (
 )
 from adaptive_resume.gui.database_manager import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
+
+# Applied once on the dialog; widgets opt in through their object names.
+_DIALOG_CSS = (
+    "QLabel#title { font-size: 18px; font-weight: bold; margin-bottom: 10px; }"
+    "QLabel#subtitle { color: #666; margin-bottom: 15px; }"
+    "QLabel#requiredHint { color: #999; font-size: 11px; }"
+    "QPushButton#importButton { font-weight: bold; padding: 8px 16px; }"
+)
+
+
+class ImportWorker(QThread):
+    """Background worker that writes extracted resume data to the database.
+
+    Uses its own session on the GUI session's engine, since SQLAlchemy
+    sessions must not be shared across threads.
+    """
+
+    progress = pyqtSignal(str)  # Progress message
+    finished = pyqtSignal(int, str, dict)  # Profile ID, profile name, import stats
+    error = pyqtSignal(str)  # Error message
+
+    def __init__(
+        self,
+        extracted: ExtractedResume,
+        profile_id: Optional[int],
+        bind,
+        parent: Optional[QWidget] = None,
+    ):
+        super().__init__(parent)
+        self.extracted = extracted
+        self.profile_id = profile_id
+        self.bind = bind
+
+    def run(self):
+        """Run the import."""
+        session = Session(bind=self.bind)
+        try:
+            self.progress.emit(
+                f"Importing {len(self.extracted.jobs)} jobs, "
+                f"{len(self.extracted.education)} education entries, "
+                f"{len(self.extracted.skills)} skills and "
+                f"{len(self.extracted.certifications)} certifications..."
+            )
+            importer = ResumeImporter(session)
+
+            profile, stats = importer.import_resume(
+                self.extracted,
+                profile_id=self.profile_id,
+                create_new_profile=(self.profile_id is None)
+            )
+            self.finished.emit(profile.id, profile.full_name, stats)
+
+        except ResumeImportError as e:
+            session.rollback()
+            self.error.emit(f"Failed to import resume data:\n\n{str(e)}")
+        except Exception as e:
+            session.rollback()
+            self.error.emit(f"An unexpected error occurred:\n\n{str(e)}")
+        finally:
+            session.close()
+
+
+class CheckListModel(QAbstractListModel):
+    """List model exposing extracted items as user-checkable rows.
+
+    Backs a ``QListView`` so Qt only creates and paints the visible rows,
+    rather than one ``QCheckBox`` widget per extracted item.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        text_fn: Callable[[Any], str],
+        parent: Optional[QWidget] = None
+    ):
+        super().__init__(parent)
+        self.items = list(items)
+        self.checked = [True] * len(self.items)
+        self._text_fn = text_fn
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._text_fn(self.items[row])
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self.checked[row] else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        if self.checked[index.row()] == checked:
+            return True
+        self.checked[index.row()] = checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsUserCheckable
+            | Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+        )
+
+    def set_all_checked(self, checked: bool) -> None:
+        """Check or uncheck every row with a single change notification.
+
+        Nothing is emitted when every row already has that state, so the
+        initial all-checked rows never trigger a repaint.
+        """
+        if not self.items or all(state == checked for state in self.checked):
+            return
+        self.checked = [checked] * len(self.items)
+        self.dataChanged.emit(
+            self.index(0),
+            self.index(len(self.items) - 1),
+            [Qt.ItemDataRole.CheckStateRole],
+        )
+
+
+class JobListModel(CheckListModel):
+    """Check list model for extracted jobs.
+
+    The display role holds the title line; location, bullet count and
+    confidence are exposed through custom roles for ``JobItemDelegate``.
+    """
+
+    LocationRole = Qt.ItemDataRole.UserRole + 1
+    BulletsRole = Qt.ItemDataRole.UserRole + 2
+    ConfidenceRole = Qt.ItemDataRole.UserRole + 3
+
+    def __init__(self, jobs: Sequence[Any], parent: Optional[QWidget] = None):
+        super().__init__(jobs, _job_text, parent)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role > Qt.ItemDataRole.UserRole:
+            job = self.items[index.row()]
+            if role == self.LocationRole and job.location:
+                return f"Location: {job.location}"
+            if role == self.BulletsRole and job.bullet_points:
+                return f"{len(job.bullet_points)} bullet points"
+            if role == self.ConfidenceRole and job.confidence_score > 0:
+                return f"Confidence: {int(job.confidence_score * 100)}%"
+            return None
+        return super().data(index, role)
+
+
+class JobItemDelegate(QStyledItemDelegate):
+    """Paints a job row (check box, title and metadata lines) directly.
+
+    Replaces the per-job ``QCheckBox`` plus metadata ``QLabel`` widgets.
+    Every row has the same height so the view can use uniform item sizes.
+    """
+
+    _META_ROLES = (
+        JobListModel.LocationRole,
+        JobListModel.BulletsRole,
+        JobListModel.ConfidenceRole,
+    )
+    _MARGIN = 4
+    _META_COLOR = QColor("#666")
+    _SEPARATOR_COLOR = QColor("#ddd")
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        # Fonts and metrics are fixed for the view's lifetime, so build them once
+        self._title_font = parent.font() if parent is not None else QApplication.font()
+        self._meta_font = QFont(self._title_font)
+        self._meta_font.setPointSizeF(max(self._title_font.pointSizeF() - 1, 1))
+        self._title_height = QFontMetrics(self._title_font).height()
+        self._meta_height = QFontMetrics(self._meta_font).height()
+
+    def _check_rect(self, option: QStyleOptionViewItem) -> QRect:
+        style = option.widget.style() if option.widget else QApplication.style()
+        width = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorWidth, option, option.widget)
+        height = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorHeight, option, option.widget)
+        return QRect(
+            option.rect.left() + self._MARGIN,
+            option.rect.top() + self._MARGIN,
+            width,
+            height,
+        )
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+
+        painter.save()
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget
+        )
+
+        check_opt = QStyleOptionViewItem(opt)
+        check_opt.rect = self._check_rect(opt)
+        check_opt.state &= ~QStyle.StateFlag.State_HasFocus
+        if index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked:
+            check_opt.state |= QStyle.StateFlag.State_On
+        else:
+            check_opt.state |= QStyle.StateFlag.State_Off
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_IndicatorItemViewItemCheck,
+            check_opt,
+            painter,
+            opt.widget,
+        )
+
+        left = check_opt.rect.right() + 2 * self._MARGIN
+        width = opt.rect.right() - left
+        top = opt.rect.top() + 2
+        title_height = self._title_height
+        meta_height = self._meta_height
+
+        painter.setFont(self._title_font)
+        painter.setPen(opt.palette.color(opt.palette.ColorRole.Text))
+        painter.drawText(
+            QRect(left, top, width, title_height),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            opt.text,
+        )
+
+        painter.setFont(self._meta_font)
+        painter.setPen(self._META_COLOR)
+        y = top + title_height
+        for role in self._META_ROLES:
+            text = index.data(role)
+            if text:
+                painter.drawText(
+                    QRect(left, y, width, meta_height),
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                    text,
+                )
+                y += meta_height
+
+        # Separator between jobs
+        if index.row() < index.model().rowCount() - 1:
+            painter.setPen(self._SEPARATOR_COLOR)
+            painter.drawLine(opt.rect.bottomLeft(), opt.rect.bottomRight())
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        height = self._title_height + len(self._META_ROLES) * self._meta_height
+        return QSize(option.rect.width(), height + 2 * self._MARGIN)
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        """Toggle the check state when the painted indicator is clicked."""
+        event_type = event.type()
+        if event_type == QEvent.Type.KeyPress:
+            if event.key() not in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+                return False
+        elif event_type in (
+            QEvent.Type.MouseButtonPress,
+            QEvent.Type.MouseButtonDblClick,
+        ):
+            return self._check_rect(option).contains(event.position().toPoint())
+        elif event_type == QEvent.Type.MouseButtonRelease:
+            if (
+                event.button() != Qt.MouseButton.LeftButton
+                or not self._check_rect(option).contains(event.position().toPoint())
+            ):
+                return False
+        else:
+            return False
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+        return model.setData(index, new_state, Qt.ItemDataRole.CheckStateRole)
+
+
+class ColumnListView(QListView):
+    """List view that wraps its rows into equal-width columns.
+
+    Used for short items such as skills, where a single column wastes
+    most of the dialog's width.
+    """
+
+    def __init__(self, columns: int = 3, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.columns = columns
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+    def viewportEvent(self, event) -> bool:
+        """Keep each grid cell at an equal share of the viewport width."""
+        if event.type() == QEvent.Type.Resize:
+            model = self.model()
+            if model is not None and model.rowCount():
+                row_height = self.sizeHintForIndex(model.index(0, 0)).height()
+                # Cells must sum to less than the width or the last one wraps
+                self.setGridSize(
+                    QSize((event.size().width() - 1) // self.columns, row_height)
+                )
+        return super().viewportEvent(event)
+
+
+def _job_text(job) -> str:
+    """Format the title line of an extracted job."""
+    parts = [f"{job.job_title} at {job.company_name}"]
+    if job.start_date:
+        end = "Present" if job.is_current else job.end_date
+        parts.append(f" ({job.start_date} - {end})" if end else f" ({job.start_date})")
+    return "".join(parts)
+
+
+def _education_text(edu) -> str:
+    """Format an extracted education entry as a list entry."""
+    parts = [edu.degree_type or "Degree"]
+    if edu.major:
+        parts.append(f" in {edu.major}")
+    parts.append(f" - {edu.school_name}")
+    if edu.graduation_date:
+        parts.append(f" ({edu.graduation_date})")
+    if edu.gpa:
+        parts.append(f"\n  GPA: {edu.gpa}")
+    return "".join(parts)
+
+
+def _certification_text(cert) -> str:
+    """Format an extracted certification as a list entry."""
+    parts = [cert.name]
+    if cert.issuing_organization:
+        parts.append(f" - {cert.issuing_organization}")
+    if cert.issue_date:
+        parts.append(f" ({cert.issue_date})")
+    return "".join(parts)
+
 
 class ResumePreviewDialog(QDialog):
     """Dialog for previewing and confirming resume import.
@@ -60,20 +419,60 @@ class ResumePreviewDialog(QDialog):
         self.extracted = extracted_resume
         self.profile_id = profile_id
         self.import_successful = False
+        self.import_worker: Optional[ImportWorker] = None
+        # Engine the import worker opens its own session on
+        self._engine = None
+
+        # Item sections are built lazily, the first time they are expanded
+        self._section_builders = {
+            "jobs": self._build_jobs_section,
+            "education": self._build_education_section,
+            "skills": self._build_skills_section,
+            "certifications": self._build_certifications_section,
+        }
+        self._section_groups: dict[str, QGroupBox] = {}
+        self._section_toggles: dict[str, QToolButton] = {}
+        self._section_content: dict[str, QWidget] = {}
 
         self.setWindowTitle("Review Resume Data")
         self.setMinimumWidth(800)
         self.setMinimumHeight(600)
+        self.setStyleSheet(_DIALOG_CSS)
 
         self._build_ui()
 
+        # Warm the connection pool once the dialog is showing, not on import click
+        QTimer.singleShot(0, self._prewarm_engine)
+
+    def _prewarm_engine(self):
+        """Look up the database engine and open a pooled connection."""
+        if self._engine is not None:
+            return
+        engine = DatabaseManager.get_session().get_bind()
+        try:
+            engine.connect().close()
+        except SQLAlchemyError as exc:
+            # The worker's session connects on first use instead
+            logger.warning("Could not prewarm database connection: %s", exc)
+        self._engine = engine
+
     def _build_ui(self):
         """Build the user interface."""
+        # Suspend repaints until every section is in place
+        self.setUpdatesEnabled(False)
+        try:
+            self._populate_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _populate_ui(self):
+        """Create the dialog's widgets and layouts."""
         layout = QVBoxLayout(self)
 
         # Title
         title = QLabel("Review Extracted Resume Data")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        title.setObjectName("title")
         layout.addWidget(title)
 
         # Subtitle with confidence score
@@ -87,7 +486,7 @@ class ResumePreviewDialog(QDialog):
 
         subtitle = QLabel(subtitle_text)
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet("color: #666; margin-bottom: 15px;")
+        subtitle.setObjectName("subtitle")
         layout.addWidget(subtitle)
 
         # Scrollable content area
@@ -102,25 +501,19 @@ class ResumePreviewDialog(QDialog):
         contact_group = self._build_contact_section()
         content_layout.addWidget(contact_group)
 
-        # Work Experience Section
-        if self.extracted.jobs:
-            jobs_group = self._build_jobs_section()
-            content_layout.addWidget(jobs_group)
-
-        # Education Section
-        if self.extracted.education:
-            edu_group = self._build_education_section()
-            content_layout.addWidget(edu_group)
-
-        # Skills Section
-        if self.extracted.skills:
-            skills_group = self._build_skills_section()
-            content_layout.addWidget(skills_group)
-
-        # Certifications Section
-        if self.extracted.certifications:
-            certs_group = self._build_certifications_section()
-            content_layout.addWidget(certs_group)
+        # Item sections (only those with extracted items)
+        extracted = self.extracted
+        sections = (
+            ("jobs", "Work Experience", extracted.jobs),
+            ("education", "Education", extracted.education),
+            ("skills", "Skills", extracted.skills),
+            ("certifications", "Certifications", extracted.certifications),
+        )
+        for name, label, items in sections:
+            if items:
+                content_layout.addWidget(
+                    self._add_section(name, f"{label} ({len(items)} found)", len(items))
+                )
 
         content_layout.addStretch()
         scroll.setWidget(content_widget)
@@ -135,16 +528,81 @@ class ResumePreviewDialog(QDialog):
         button_layout.addWidget(cancel_button)
 
         import_button = QPushButton("Import Resume Data")
-        import_button.setStyleSheet("font-weight: bold; padding: 8px 16px;")
+        import_button.setObjectName("importButton")
         import_button.clicked.connect(self._import_resume)
         button_layout.addWidget(import_button)
 
         layout.addLayout(button_layout)
 
+    def _add_section(self, name: str, title: str, count: int) -> QGroupBox:
+        """Create a collapsed placeholder group for an item section.
+
+        The section's list is only built when its disclosure button is first
+        expanded; until then every item in the section is imported, which the
+        collapsed button says in its label.
+        """
+        group = QGroupBox(title)
+        section_layout = QVBoxLayout()
+        section_layout.setSpacing(2)
+        section_layout.setContentsMargins(4, 4, 4, 4)
+        group.setLayout(section_layout)
+
+        toggle = QToolButton()
+        toggle.setCheckable(True)
+        toggle.setAutoRaise(True)
+        toggle.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        toggle.setToolTip("Expand to review and deselect individual items")
+        toggle.setProperty("item_count", count)
+        toggle.toggled.connect(partial(self._on_section_toggled, name))
+        section_layout.addWidget(toggle)
+
+        self._section_groups[name] = group
+        self._section_toggles[name] = toggle
+        self._update_section_toggle(name, expanded=False)
+        return group
+
+    def _update_section_toggle(self, name: str, expanded: bool):
+        """Point the disclosure arrow and say what the collapsed state imports."""
+        toggle = self._section_toggles[name]
+        if expanded:
+            toggle.setArrowType(Qt.ArrowType.DownArrow)
+            toggle.setText("Hide items")
+            return
+        toggle.setArrowType(Qt.ArrowType.RightArrow)
+        if name in self._section_content:
+            # Once built, the checked items are imported whether shown or not
+            toggle.setText("Show items (only checked items will be imported)")
+        else:
+            toggle.setText(
+                f"All {toggle.property('item_count')} items will be imported — expand to choose"
+            )
+
+    def _on_section_toggled(self, name: str, expanded: bool):
+        """Build a section on first expansion and show/hide it afterwards."""
+        content = self._section_content.get(name)
+        if content is None:
+            if not expanded:
+                return
+            group = self._section_groups[name]
+            group.setUpdatesEnabled(False)
+            try:
+                content = self._section_builders[name]()
+                group.layout().addWidget(content)
+                self._section_content[name] = content
+            finally:
+                group.setUpdatesEnabled(True)
+        content.setVisible(expanded)
+        self._update_section_toggle(name, expanded)
+
     def _build_contact_section(self) -> QGroupBox:
         """Build the contact information section."""
         group = QGroupBox("Contact Information")
         layout = QFormLayout()
+        layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+        layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.setFormAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.setHorizontalSpacing(8)
+        layout.setVerticalSpacing(4)
 
         self.first_name_edit = QLineEdit(self.extracted.first_name or "")
         self.last_name_edit = QLineEdit(self.extracted.last_name or "")
@@ -165,185 +623,89 @@ class ResumePreviewDialog(QDialog):
         layout.addRow("Website:", self.website_edit)
 
         required_label = QLabel("* Required fields")
-        required_label.setStyleSheet("color: #999; font-size: 11px;")
-        layout.addRow("", required_label)
+        required_label.setObjectName("requiredHint")
+        layout.addRow(required_label)
 
         group.setLayout(layout)
         return group
 
-    def _build_jobs_section(self) -> QGroupBox:
+    def _make_list_view(
+        self,
+        model: CheckListModel,
+        uniform: bool = True,
+        max_visible_rows: int = 8,
+        view: Optional[QListView] = None
+    ) -> QListView:
+        """Create a list view over ``model`` sized to its first few rows."""
+        if view is None:
+            view = QListView()
+        view.setUniformItemSizes(uniform)
+        view.setModel(model)
+        view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        columns = getattr(view, "columns", 1)
+        total_rows = -(-model.rowCount() // columns)
+        visible_rows = min(total_rows, max_visible_rows)
+        row_height = view.sizeHintForRow(0) if visible_rows else 0
+        view.setMinimumHeight(visible_rows * row_height + 2 * view.frameWidth())
+        return view
+
+    def _build_jobs_section(self) -> QWidget:
         """Build the work experience section."""
-        group = QGroupBox(f"Work Experience ({len(self.extracted.jobs)} found)")
-        layout = QVBoxLayout()
-
-        self.job_checkboxes = []
-
-        for i, job in enumerate(self.extracted.jobs):
-            job_widget = QWidget()
-            job_layout = QVBoxLayout(job_widget)
-            job_layout.setContentsMargins(0, 5, 0, 5)
-
-            # Checkbox with job title and company
-            job_text = f"{job.job_title} at {job.company_name}"
-            if job.start_date:
-                job_text += f" ({job.start_date}"
-                if job.is_current:
-                    job_text += " - Present)"
-                elif job.end_date:
-                    job_text += f" - {job.end_date})"
-                else:
-                    job_text += ")"
-
-            checkbox = QCheckBox(job_text)
-            checkbox.setChecked(True)
-            self.job_checkboxes.append(checkbox)
-            job_layout.addWidget(checkbox)
-
-            # Location
-            if job.location:
-                location_label = QLabel(f"  Location: {job.location}")
-                location_label.setStyleSheet("color: #666; font-size: 12px;")
-                job_layout.addWidget(location_label)
-
-            # Bullet points
-            if job.bullet_points:
-                bullets_label = QLabel(f"  {len(job.bullet_points)} bullet points")
-                bullets_label.setStyleSheet("color: #666; font-size: 12px;")
-                job_layout.addWidget(bullets_label)
-
-            # Confidence
-            if job.confidence_score > 0:
-                confidence = int(job.confidence_score * 100)
-                conf_label = QLabel(f"  Confidence: {confidence}%")
-                conf_label.setStyleSheet("color: #999; font-size: 11px;")
-                job_layout.addWidget(conf_label)
-
-            layout.addWidget(job_widget)
-
-            # Separator
-            if i < len(self.extracted.jobs) - 1:
-                separator = QLabel()
-                separator.setStyleSheet("border-bottom: 1px solid #ddd;")
-                separator.setMaximumHeight(1)
-                layout.addWidget(separator)
-
-        group.setLayout(layout)
-        return group
+        self.jobs_model = JobListModel(self.extracted.jobs, self)
+        view = QListView()
+        view.setItemDelegate(JobItemDelegate(view))
+        return self._make_list_view(self.jobs_model, view=view)
 
-    def _build_education_section(self) -> QGroupBox:
+    def _build_education_section(self) -> QWidget:
         """Build the education section."""
-        group = QGroupBox(f"Education ({len(self.extracted.education)} found)")
-        layout = QVBoxLayout()
-
-        self.edu_checkboxes = []
-
-        for i, edu in enumerate(self.extracted.education):
-            edu_text = f"{edu.degree_type or 'Degree'}"
-            if edu.major:
-                edu_text += f" in {edu.major}"
-            edu_text += f" - {edu.school_name}"
-            if edu.graduation_date:
-                edu_text += f" ({edu.graduation_date})"
-
-            checkbox = QCheckBox(edu_text)
-            checkbox.setChecked(True)
-            self.edu_checkboxes.append(checkbox)
-            layout.addWidget(checkbox)
-
-            # GPA
-            if edu.gpa:
-                gpa_label = QLabel(f"  GPA: {edu.gpa}")
-                gpa_label.setStyleSheet("color: #666; font-size: 12px; margin-left: 20px;")
-                layout.addWidget(gpa_label)
+        self.education_model = CheckListModel(
+            self.extracted.education, _education_text, self
+        )
+        return self._make_list_view(self.education_model, uniform=False)
 
-        group.setLayout(layout)
-        return group
-
-    def _build_skills_section(self) -> QGroupBox:
+    def _build_skills_section(self) -> QWidget:
         """Build the skills section."""
-        group = QGroupBox(f"Skills ({len(self.extracted.skills)} found)")
-        layout = QVBoxLayout()
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
 
         # Select All / Deselect All buttons
         button_layout = QHBoxLayout()
         select_all = QPushButton("Select All")
-        select_all.clicked.connect(lambda: self._toggle_all_skills(True))
+        select_all.clicked.connect(partial(self._toggle_all_skills, True))
         button_layout.addWidget(select_all)
 
         deselect_all = QPushButton("Deselect All")
-        deselect_all.clicked.connect(lambda: self._toggle_all_skills(False))
+        deselect_all.clicked.connect(partial(self._toggle_all_skills, False))
         button_layout.addWidget(deselect_all)
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
-        # Skills as checkboxes (in a grid-like layout)
-        skills_widget = QWidget()
-        skills_layout = QVBoxLayout(skills_widget)
-        self.skill_checkboxes = []
-
-        row_layout = None
-        for i, skill in enumerate(self.extracted.skills):
-            if i % 3 == 0:  # 3 skills per row
-                row_layout = QHBoxLayout()
-                skills_layout.addLayout(row_layout)
-
-            checkbox = QCheckBox(skill)
-            checkbox.setChecked(True)
-            self.skill_checkboxes.append(checkbox)
-            row_layout.addWidget(checkbox)
-
-        # Fill remaining cells in last row
-        if row_layout:
-            remaining = len(self.extracted.skills) % 3
-            if remaining > 0:
-                for _ in range(3 - remaining):
-                    row_layout.addStretch()
-
-        layout.addWidget(skills_widget)
-        group.setLayout(layout)
-        return group
+        self.skills_model = CheckListModel(self.extracted.skills, str, self)
+        layout.addWidget(
+            self._make_list_view(self.skills_model, view=ColumnListView(3))
+        )
+        return widget
 
-    def _build_certifications_section(self) -> QGroupBox:
+    def _build_certifications_section(self) -> QWidget:
         """Build the certifications section."""
-        group = QGroupBox(f"Certifications ({len(self.extracted.certifications)} found)")
-        layout = QVBoxLayout()
-
-        self.cert_checkboxes = []
-
-        for cert in self.extracted.certifications:
-            cert_text = cert.name
-            if cert.issuing_organization:
-                cert_text += f" - {cert.issuing_organization}"
-            if cert.issue_date:
-                cert_text += f" ({cert.issue_date})"
-
-            checkbox = QCheckBox(cert_text)
-            checkbox.setChecked(True)
-            self.cert_checkboxes.append(checkbox)
-            layout.addWidget(checkbox)
-
-        group.setLayout(layout)
-        return group
+        self.certifications_model = CheckListModel(
+            self.extracted.certifications, _certification_text, self
+        )
+        return self._make_list_view(self.certifications_model)
 
     def _toggle_all_skills(self, checked: bool):
-        """Toggle all skill checkboxes."""
-        for checkbox in self.skill_checkboxes:
-            checkbox.setChecked(checked)
+        """Check or uncheck every skill."""
+        self.skills_model.set_all_checked(checked)
 
     def _import_resume(self):
         """Import the selected resume data."""
-        # Update extracted resume with edited contact info
-        self.extracted.first_name = self.first_name_edit.text().strip()
-        self.extracted.last_name = self.last_name_edit.text().strip()
-        self.extracted.email = self.email_edit.text().strip()
-        self.extracted.phone = self.phone_edit.text().strip()
-        self.extracted.location = self.location_edit.text().strip()
-        self.extracted.linkedin_url = self.linkedin_edit.text().strip()
-        self.extracted.github_url = self.github_edit.text().strip()
-        self.extracted.website_url = self.website_edit.text().strip()
+        first_name = self.first_name_edit.text().strip()
+        last_name = self.last_name_edit.text().strip()
+        email = self.email_edit.text().strip()
 
-        # Validate required fields
-        if not self.extracted.first_name or not self.extracted.last_name:
+        # Validate required fields before touching the extracted resume
+        if not first_name or not last_name:
             QMessageBox.warning(
                 self,
                 "Missing Information",
@@ -351,7 +713,7 @@ class ResumePreviewDialog(QDialog):
             )
             return
 
-        if not self.extracted.email:
+        if not email:
             QMessageBox.warning(
                 self,
                 "Missing Information",
@@ -359,26 +721,47 @@ class ResumePreviewDialog(QDialog):
             )
             return
 
-        # Filter selected items
-        selected_jobs = [
-            job for i, job in enumerate(self.extracted.jobs)
-            if i < len(self.job_checkboxes) and self.job_checkboxes[i].isChecked()
-        ]
-
-        selected_edu = [
-            edu for i, edu in enumerate(self.extracted.education)
-            if i < len(self.edu_checkboxes) and self.edu_checkboxes[i].isChecked()
-        ]
-
-        selected_skills = [
-            skill for i, skill in enumerate(self.extracted.skills)
-            if i < len(self.skill_checkboxes) and self.skill_checkboxes[i].isChecked()
-        ]
+        # Update extracted resume with edited contact info
+        self.extracted.first_name = first_name
+        self.extracted.last_name = last_name
+        self.extracted.email = email
+        self.extracted.phone = self.phone_edit.text().strip()
+        self.extracted.location = self.location_edit.text().strip()
+        self.extracted.linkedin_url = self.linkedin_edit.text().strip()
+        self.extracted.github_url = self.github_edit.text().strip()
+        self.extracted.website_url = self.website_edit.text().strip()
 
-        selected_certs = [
-            cert for i, cert in enumerate(self.extracted.certifications)
-            if i < len(self.cert_checkboxes) and self.cert_checkboxes[i].isChecked()
-        ]
+        # Filter selected items; sections never expanded import everything
+        selected_jobs = self.extracted.jobs
+        if "jobs" in self._section_content:
+            selected_jobs = [
+                job
+                for job, keep in zip(self.jobs_model.items, self.jobs_model.checked)
+                if keep
+            ]
+
+        selected_edu = self.extracted.education
+        if "education" in self._section_content:
+            selected_edu = [
+                edu
+                for edu, keep in zip(self.education_model.items, self.education_model.checked)
+                if keep
+            ]
+
+        selected_skills = self.extracted.skills
+        if "skills" in self._section_content:
+            selected_skills = [
+                skill
+                for skill, keep in zip(self.skills_model.items, self.skills_model.checked)
+                if keep
+            ]
+
+        selected_certs = self.extracted.certifications
+        if "certifications" in self._section_content:
+            model = self.certifications_model
+            selected_certs = [
+                cert for cert, keep in zip(model.items, model.checked) if keep
+            ]
 
         # Update extracted resume with selections
         self.extracted.jobs = selected_jobs
@@ -386,7 +769,7 @@ class ResumePreviewDialog(QDialog):
         self.extracted.skills = selected_skills
         self.extracted.certifications = selected_certs
 
-        # Show progress dialog
+        # Show progress dialog while the import runs in the background
         progress = QProgressDialog("Importing resume data...", None, 0, 0, self)
         progress.setWindowTitle("Importing")
         progress.setWindowModality(Qt.WindowModality.WindowModal)
@@ -394,54 +777,67 @@ class ResumePreviewDialog(QDialog):
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
-        try:
-            # Import using ResumeImporter service
-            session = DatabaseManager.get_session()
-            importer = ResumeImporter(session)
-
-            profile, stats = importer.import_resume(
-                self.extracted,
-                profile_id=self.profile_id,
-                create_new_profile=(self.profile_id is None)
-            )
-
-            progress.close()
-
-            # Show success message
-            success_msg = f"Successfully imported resume data!\n\n"
-            success_msg += f"Profile: {profile.full_name}\n"
-            success_msg += f"Jobs: {stats['jobs_created']}\n"
-            success_msg += f"Bullet Points: {stats['bullet_points_created']}\n"
-            success_msg += f"Education: {stats['education_created']}\n"
-            success_msg += f"Skills: {stats['skills_created']}\n"
-            success_msg += f"Certifications: {stats['certifications_created']}\n"
-
-            if stats['errors']:
-                success_msg += f"\nWarnings: {len(stats['errors'])} items had issues"
-
-            QMessageBox.information(
-                self,
-                "Import Successful",
-                success_msg
-            )
-
-            self.import_successful = True
-            self.accept()
-
-        except ResumeImportError as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"Failed to import resume data:\n\n{str(e)}"
-            )
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"An unexpected error occurred:\n\n{str(e)}"
+        self._prewarm_engine()
+        self.import_worker = ImportWorker(self.extracted, self.profile_id, self._engine, self)
+        self.import_worker.progress.connect(progress.setLabelText)
+        self.import_worker.finished.connect(
+            lambda profile_id, profile_name, stats: self._on_import_complete(
+                profile_name, stats, progress
             )
+        )
+        self.import_worker.error.connect(
+            lambda err: self._on_import_error(err, progress)
+        )
+        self.import_worker.start()
+
+    def _on_import_complete(self, profile_name: str, stats: dict, progress: QProgressDialog):
+        """Handle a successful import."""
+        # run() still closes its session after emitting; let it finish first
+        self.import_worker.wait()
+        progress.close()
+
+        # Show success message
+        lines = [
+            "Successfully imported resume data!",
+            "",
+            f"Profile: {profile_name}",
+            f"Jobs: {stats['jobs_created']}",
+            f"Bullet Points: {stats['bullet_points_created']}",
+            f"Education: {stats['education_created']}",
+            f"Skills: {stats['skills_created']}",
+            f"Certifications: {stats['certifications_created']}",
+        ]
+        if stats['errors']:
+            lines.append(f"\nWarnings: {len(stats['errors'])} items had issues")
+        success_msg = "\n".join(lines)
+
+        QMessageBox.information(
+            self,
+            "Import Successful",
+            success_msg
+        )
+
+        self.import_successful = True
+        self.accept()
+
+    def _on_import_error(self, error: str, progress: QProgressDialog):
+        """Handle an import failure."""
+        progress.close()
+        QMessageBox.critical(
+            self,
+            "Import Failed",
+            error
+        )
+
+    def reject(self):
+        """Close the dialog, unless an import is still being written.
+
+        Closing from the title bar goes through here too, so the running
+        worker is never destroyed with the dialog.
+        """
+        if self.import_worker is not None and self.import_worker.isRunning():
+            return
+        super().reject()
 
     def was_successful(self) -> bool:
         """Return whether the import was successful."""
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Optional, List
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set
 import json
 
 try:
@@ -12,8 +14,7 @@ try:
         QHBoxLayout,
         QLabel,
         QPushButton,
-        QTableWidget,
-        QTableWidgetItem,
+        QTableView,
         QGroupBox,
         QComboBox,
         QTextEdit,
@@ -22,9 +23,10 @@ try:
         QAbstractItemView,
         QInputDialog,
         QWidget,
+        QStyledItemDelegate,
     )
-    from PyQt6.QtCore import Qt, pyqtSignal
-    from PyQt6.QtGui import QIcon
+    from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSignalBlocker, pyqtSignal
+    from PyQt6.QtGui import QColor, QIcon, QPalette
 except ImportError as exc:  # pragma: no cover
     raise ImportError("PyQt6 is required to use the GUI components") from exc
 
@@ -33,8 +35,8 @@ from adaptive_resume.models.tailored_resume import TailoredResumeModel
 from adaptive_resume.gui.database_manager import DatabaseManager
 
 
-# Predefined variant strategies
-VARIANT_STRATEGIES = {
+# Predefined variant strategies (read-only; combo order follows this order)
+VARIANT_STRATEGIES = MappingProxyType({
     "Conservative": {
         "description": "Fewer bullets, proven accomplishments only, traditional focus",
         "notes": "Conservative approach with only the strongest, most relevant accomplishments."
@@ -59,7 +61,162 @@ VARIANT_STRATEGIES = {
         "description": "Create your own custom variant",
         "notes": ""
     }
-}
+})
+
+
+# Stylesheets shared by every dialog instance so Qt sees identical strings.
+_TITLE_CSS = "font-size: 18px; font-weight: bold; margin-bottom: 10px;"
+_SUBTITLE_CSS = "color: #666; margin-bottom: 15px;"
+_FIELD_LABEL_CSS = "font-weight: bold;"
+_CREATE_BUTTON_CSS = "font-weight: bold; padding: 6px 12px;"
+_NOTES_LABEL_CSS = "font-weight: bold; margin-bottom: 10px;"
+_COMPARISON_TITLE_CSS = "font-size: 16px; font-weight: bold; margin-bottom: 10px;"
+
+# (combo label, strategy key) pairs, formatted once at import
+_STRATEGY_ITEMS = tuple(
+    (f"{name} - {info['description']}", name)
+    for name, info in VARIANT_STRATEGIES.items()
+)
+
+
+def _preview(text: Optional[str], length: int = 50) -> str:
+    """Return ``text`` cut to ``length`` characters with an ellipsis."""
+    if not text:
+        return ""
+    # The precision spec truncates and appends in a single string build
+    return text if len(text) <= length else f"{text:.{length}}..."
+
+
+def _percent(fraction: Optional[float]) -> str:
+    """Format a 0.0-1.0 fraction as a one-decimal percentage."""
+    return f"{(fraction or 0) * 100:.1f}%"
+
+
+# Section rules for the plain-text variant comparison
+_RULE = "=" * 80
+_THIN_RULE = "-" * 80
+
+
+_shared_service: Optional[ResumeVariantService] = None
+
+
+def _get_shared_service() -> ResumeVariantService:
+    """Return a variant service bound to the application's database session.
+
+    The service is created once and reused across dialog opens; it is only
+    rebuilt if ``DatabaseManager`` has since handed out a different session.
+    """
+    global _shared_service
+    session = DatabaseManager.get_session()
+    if _shared_service is None or _shared_service.session is not session:
+        _shared_service = ResumeVariantService(session)
+    return _shared_service
+
+
+class VariantsTableModel(QAbstractTableModel):
+    """Table model over the variants of a job posting.
+
+    Cell text is formatted on demand in ``data()``, so only rows Qt
+    actually paints are formatted, instead of creating a
+    ``QTableWidgetItem`` for every cell on each reload.
+    """
+
+    HEADERS = ("Variant", "Created", "Match Score", "Coverage", "Primary", "Notes")
+    PRIMARY_COLUMN = 4
+
+    PrimaryRole = Qt.ItemDataRole.UserRole + 1
+
+    # Theme lookups hit the icon cache on disk, so resolve the star once
+    _PRIMARY_ICON: Optional[QIcon] = None
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._variants: List[TailoredResumeModel] = []
+        if VariantsTableModel._PRIMARY_ICON is None:
+            VariantsTableModel._PRIMARY_ICON = QIcon.fromTheme("starred")
+
+    def set_variants(self, variants: List[TailoredResumeModel]) -> None:
+        """Replace the displayed variants."""
+        self.beginResetModel()
+        self._variants = list(variants)
+        self.endResetModel()
+
+    def append_variant(self, variant: TailoredResumeModel) -> None:
+        """Add a variant as the last row."""
+        row = len(self._variants)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._variants.append(variant)
+        self.endInsertRows()
+
+    def remove_variant(self, variant: TailoredResumeModel) -> None:
+        """Remove the row showing ``variant``."""
+        row = self._variants.index(variant)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._variants[row]
+        self.endRemoveRows()
+
+    def refresh_variant(self, variant: TailoredResumeModel) -> None:
+        """Repaint the row showing ``variant`` after it was edited in place."""
+        row = self._variants.index(variant)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def variant_at(self, row: int) -> Optional[TailoredResumeModel]:
+        """Return the variant shown in ``row``, if any."""
+        if 0 <= row < len(self._variants):
+            return self._variants[row]
+        return None
+
+    @staticmethod
+    def _display_text(variant: TailoredResumeModel, column: int) -> str:
+        if column == 0:
+            return variant.variant_name or f"Variant {variant.variant_number}"
+        if column == 1:
+            return variant.formatted_created_at
+        if column == 2:
+            return variant.formatted_match_score
+        if column == 3:
+            return variant.formatted_coverage
+        if column == VariantsTableModel.PRIMARY_COLUMN:
+            return "✓ Yes" if variant.is_primary else "No"
+        return _preview(variant.notes)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._variants)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        variant = self._variants[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(variant, column)
+        if role == Qt.ItemDataRole.DecorationRole and column == 0 and variant.is_primary:
+            return self._PRIMARY_ICON
+        if role == Qt.ItemDataRole.UserRole:
+            return variant.id
+        if role == self.PrimaryRole:
+            return variant.is_primary
+        return None
+
+
+class PrimaryColumnDelegate(QStyledItemDelegate):
+    """Draws the Primary column's text in green for the primary variant."""
+
+    _PRIMARY_COLOR = QColor(Qt.GlobalColor.darkGreen)
+
+    def initStyleOption(self, option, index: QModelIndex) -> None:
+        super().initStyleOption(option, index)
+        if index.data(VariantsTableModel.PrimaryRole):
+            option.palette.setColor(QPalette.ColorRole.Text, self._PRIMARY_COLOR)
 
 
 class ResumeVariantsDialog(QDialog):
@@ -83,7 +240,8 @@ class ResumeVariantsDialog(QDialog):
         self,
         job_posting_id: int,
         current_variant_id: Optional[int] = None,
-        parent: Optional[QWidget] = None
+        parent: Optional[QWidget] = None,
+        variant_service: Optional[ResumeVariantService] = None
     ):
         """Initialize the variants dialog.
 
@@ -91,14 +249,22 @@ class ResumeVariantsDialog(QDialog):
             job_posting_id: ID of the job posting
             current_variant_id: ID of the currently active variant (if any)
             parent: Parent widget
+            variant_service: Service to use; defaults to a shared instance
+                bound to the application's database session
         """
         super().__init__(parent)
         self.job_posting_id = job_posting_id
         self.current_variant_id = current_variant_id
-        self.session = DatabaseManager.get_session()
-        self.variant_service = ResumeVariantService(self.session)
+        self.variant_service = variant_service or _get_shared_service()
+        self.session = self.variant_service.session
 
         self.variants: List[TailoredResumeModel] = []
+        self._by_id: Dict[int, TailoredResumeModel] = {}
+        self._names: Set[str] = set()
+        self._primary_variant: Optional[TailoredResumeModel] = None
+        self._comparison_cache: Dict[tuple, str] = {}
+        self._comparison_dialog: Optional[QDialog] = None
+        self._comparison_text_edit: Optional[QTextEdit] = None
         self.selected_variant_id: Optional[int] = None
 
         self.setWindowTitle("Resume Variants")
@@ -114,7 +280,7 @@ class ResumeVariantsDialog(QDialog):
 
         # Title
         title = QLabel("Resume Variants")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        title.setStyleSheet(_TITLE_CSS)
         layout.addWidget(title)
 
         # Subtitle
@@ -123,7 +289,7 @@ class ResumeVariantsDialog(QDialog):
             "Create variants to test different approaches and track which works best."
         )
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet("color: #666; margin-bottom: 15px;")
+        subtitle.setStyleSheet(_SUBTITLE_CSS)
         layout.addWidget(subtitle)
 
         # Variants table
@@ -152,11 +318,18 @@ class ResumeVariantsDialog(QDialog):
         layout = QVBoxLayout()
 
         # Variants table
-        self.variants_table = QTableWidget()
-        self.variants_table.setColumnCount(6)
-        self.variants_table.setHorizontalHeaderLabels([
-            "Variant", "Created", "Match Score", "Coverage", "Primary", "Notes"
-        ])
+        self.variants_model = VariantsTableModel(self)
+        # Any change to the listed variants invalidates cached comparisons;
+        # updated_at in the cache key only has one-second resolution
+        for signal in (
+            self.variants_model.modelReset,
+            self.variants_model.rowsInserted,
+            self.variants_model.rowsRemoved,
+            self.variants_model.dataChanged,
+        ):
+            signal.connect(lambda *_: self._comparison_cache.clear())
+        self.variants_table = QTableView()
+        self.variants_table.setModel(self.variants_model)
 
         # Configure table
         self.variants_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -171,7 +344,16 @@ class ResumeVariantsDialog(QDialog):
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
 
-        self.variants_table.itemSelectionChanged.connect(self._on_variant_selected)
+        self.variants_table.setItemDelegateForColumn(
+            VariantsTableModel.PRIMARY_COLUMN, PrimaryColumnDelegate(self.variants_table)
+        )
+
+        # Fixed row heights so Qt never measures rows to lay them out
+        vertical_header = self.variants_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(24)
+
+        self.variants_table.selectionModel().selectionChanged.connect(self._on_variant_selected)
 
         layout.addWidget(self.variants_table)
 
@@ -187,22 +369,19 @@ class ResumeVariantsDialog(QDialog):
         create_layout = QHBoxLayout()
 
         create_label = QLabel("Create New Variant:")
-        create_label.setStyleSheet("font-weight: bold;")
+        create_label.setStyleSheet(_FIELD_LABEL_CSS)
         create_layout.addWidget(create_label)
 
         self.strategy_combo = QComboBox()
         self.strategy_combo.setMinimumWidth(250)
 
-        for strategy_name, strategy_info in VARIANT_STRATEGIES.items():
-            self.strategy_combo.addItem(
-                f"{strategy_name} - {strategy_info['description']}",
-                strategy_name
-            )
+        for label, strategy_name in _STRATEGY_ITEMS:
+            self.strategy_combo.addItem(label, strategy_name)
 
         create_layout.addWidget(self.strategy_combo)
 
         create_button = QPushButton("Create Variant")
-        create_button.setStyleSheet("font-weight: bold; padding: 6px 12px;")
+        create_button.setStyleSheet(_CREATE_BUTTON_CSS)
         create_button.clicked.connect(self._create_variant)
         create_layout.addWidget(create_button)
 
@@ -212,30 +391,19 @@ class ResumeVariantsDialog(QDialog):
         # Variant management buttons
         management_layout = QHBoxLayout()
 
-        self.edit_button = QPushButton("Edit Notes")
-        self.edit_button.setEnabled(False)
-        self.edit_button.clicked.connect(self._edit_variant_notes)
-        management_layout.addWidget(self.edit_button)
-
-        self.rename_button = QPushButton("Rename")
-        self.rename_button.setEnabled(False)
-        self.rename_button.clicked.connect(self._rename_variant)
-        management_layout.addWidget(self.rename_button)
-
-        self.primary_button = QPushButton("Mark as Primary")
-        self.primary_button.setEnabled(False)
-        self.primary_button.clicked.connect(self._mark_as_primary)
-        management_layout.addWidget(self.primary_button)
-
-        self.compare_button = QPushButton("Compare Variants")
-        self.compare_button.setEnabled(False)
-        self.compare_button.clicked.connect(self._compare_variants)
-        management_layout.addWidget(self.compare_button)
-
-        self.delete_button = QPushButton("Delete")
-        self.delete_button.setEnabled(False)
-        self.delete_button.clicked.connect(self._delete_variant)
-        management_layout.addWidget(self.delete_button)
+        # (attribute, label, action) for each button; all share one slot
+        for attr, label, action in (
+            ("edit_button", "Edit Notes", "edit_variant_notes"),
+            ("rename_button", "Rename", "rename_variant"),
+            ("primary_button", "Mark as Primary", "mark_as_primary"),
+            ("compare_button", "Compare Variants", "compare_variants"),
+            ("delete_button", "Delete", "delete_variant"),
+        ):
+            button = QPushButton(label)
+            button.setEnabled(False)
+            button.clicked.connect(partial(self._action, action))
+            management_layout.addWidget(button)
+            setattr(self, attr, button)
 
         management_layout.addStretch()
         layout.addLayout(management_layout)
@@ -243,75 +411,90 @@ class ResumeVariantsDialog(QDialog):
         group.setLayout(layout)
         return group
 
+    def _action(self, name: str, *_args) -> None:
+        """Dispatch a management button click to ``self._<name>``."""
+        getattr(self, f"_{name}")()
+
+    def reset(self, job_posting_id: int, current_variant_id: Optional[int] = None):
+        """Point an already-built dialog at another job posting.
+
+        Lets callers keep one dialog and reuse its widgets across opens;
+        only the variant data is reloaded.
+
+        Args:
+            job_posting_id: ID of the job posting
+            current_variant_id: ID of the currently active variant (if any)
+        """
+        self.job_posting_id = job_posting_id
+        self.current_variant_id = current_variant_id
+        self.strategy_combo.setCurrentIndex(0)
+        self._load_variants()
+
     def _load_variants(self):
         """Load variants from the database."""
         self.variants = self.variant_service.list_variants(self.job_posting_id)
+        self._by_id = {v.id: v for v in self.variants}
+        self._names = {v.variant_name for v in self.variants if v.variant_name}
+        self._primary_variant = self._find_primary()
         self._populate_table()
 
         # Enable compare button if 2+ variants
         self.compare_button.setEnabled(len(self.variants) >= 2)
 
+    def _find_primary(self) -> Optional[TailoredResumeModel]:
+        """Return the primary variant, falling back to the first one."""
+        return next(
+            (v for v in self.variants if v.is_primary),
+            self.variants[0] if self.variants else None
+        )
+
+    def _variant_added(self, variant: TailoredResumeModel):
+        """Show a newly created variant without reloading the table."""
+        self.variants.append(variant)
+        self._by_id[variant.id] = variant
+        if variant.variant_name:
+            self._names.add(variant.variant_name)
+        self.variants_model.append_variant(variant)
+        self.compare_button.setEnabled(len(self.variants) >= 2)
+
+    def _variant_removed(self, variant: TailoredResumeModel):
+        """Drop a deleted variant without reloading the table."""
+        self.variants.remove(variant)
+        self._by_id.pop(variant.id, None)
+        self._names.discard(variant.variant_name)
+        if variant is self._primary_variant:
+            # The service promotes another variant; pick it up from the rows
+            self._primary_variant = self._find_primary()
+        self.variants_model.remove_variant(variant)
+        self.compare_button.setEnabled(len(self.variants) >= 2)
+        self._on_variant_selected()
+
     def _populate_table(self):
         """Populate the variants table."""
-        self.variants_table.setRowCount(len(self.variants))
-
-        for row, variant in enumerate(self.variants):
-            # Variant name
-            name = variant.variant_name or f"Variant {variant.variant_number}"
-            name_item = QTableWidgetItem(name)
-            if variant.is_primary:
-                name_item.setIcon(QIcon.fromTheme("starred"))
-            self.variants_table.setItem(row, 0, name_item)
-
-            # Created date
-            created_str = variant.created_at.strftime("%Y-%m-%d %H:%M") if variant.created_at else "N/A"
-            self.variants_table.setItem(row, 1, QTableWidgetItem(created_str))
-
-            # Match score
-            match_score = variant.formatted_match_score
-            self.variants_table.setItem(row, 2, QTableWidgetItem(match_score))
-
-            # Coverage
-            coverage = variant.formatted_coverage
-            self.variants_table.setItem(row, 3, QTableWidgetItem(coverage))
-
-            # Primary indicator
-            primary_text = "✓ Yes" if variant.is_primary else "No"
-            primary_item = QTableWidgetItem(primary_text)
-            if variant.is_primary:
-                primary_item.setForeground(Qt.GlobalColor.darkGreen)
-            self.variants_table.setItem(row, 4, primary_item)
-
-            # Notes preview
-            notes_preview = variant.notes[:50] + "..." if variant.notes and len(variant.notes) > 50 else (variant.notes or "")
-            self.variants_table.setItem(row, 5, QTableWidgetItem(notes_preview))
-
-            # Store variant ID in row data
-            self.variants_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, variant.id)
+        # Resetting the model drops the selection; update the buttons once
+        # afterwards instead of reacting to selection signals mid-reset
+        with QSignalBlocker(self.variants_table.selectionModel()):
+            self.variants_model.set_variants(self.variants)
+        self._on_variant_selected()
 
     def _on_variant_selected(self):
         """Handle variant selection."""
-        selected_rows = self.variants_table.selectedItems()
-
-        if selected_rows:
-            row = selected_rows[0].row()
-            variant_id = self.variants_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-            self.selected_variant_id = variant_id
-
-            # Get the selected variant
-            selected_variant = next((v for v in self.variants if v.id == variant_id), None)
+        selected_rows = self.variants_table.selectionModel().selectedRows()
+        selected_variant = (
+            self.variants_model.variant_at(selected_rows[0].row()) if selected_rows else None
+        )
+        self.selected_variant_id = selected_variant.id if selected_variant else None
+        has_selection = selected_variant is not None
 
-            # Enable/disable buttons
-            self.edit_button.setEnabled(True)
-            self.rename_button.setEnabled(True)
-            self.delete_button.setEnabled(len(self.variants) > 1)  # Can't delete last variant
-            self.primary_button.setEnabled(selected_variant and not selected_variant.is_primary)
-        else:
-            self.selected_variant_id = None
-            self.edit_button.setEnabled(False)
-            self.rename_button.setEnabled(False)
-            self.delete_button.setEnabled(False)
-            self.primary_button.setEnabled(False)
+        # Enable/disable buttons with a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.edit_button.setEnabled(has_selection)
+            self.rename_button.setEnabled(has_selection)
+            self.delete_button.setEnabled(has_selection and len(self.variants) > 1)  # Can't delete last variant
+            self.primary_button.setEnabled(has_selection and not selected_variant.is_primary)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _create_variant(self):
         """Create a new variant."""
@@ -326,7 +509,7 @@ class ResumeVariantsDialog(QDialog):
             return
 
         # Get base variant (use primary or first variant)
-        base_variant = next((v for v in self.variants if v.is_primary), self.variants[0])
+        base_variant = self._primary_variant
 
         # Get variant name
         if strategy == "Custom":
@@ -340,8 +523,7 @@ class ResumeVariantsDialog(QDialog):
             variant_name = variant_name.strip()
         else:
             # Check if strategy already exists
-            existing = next((v for v in self.variants if v.variant_name == strategy), None)
-            if existing:
+            if strategy in self._names:
                 QMessageBox.warning(
                     self,
                     "Variant Exists",
@@ -370,7 +552,7 @@ class ResumeVariantsDialog(QDialog):
                 "generate a PDF with different settings."
             )
 
-            self._load_variants()
+            self._variant_added(new_variant)
             self.variant_created.emit(new_variant.id)
 
         except ValueError as e:
@@ -383,7 +565,7 @@ class ResumeVariantsDialog(QDialog):
         if not self.selected_variant_id:
             return
 
-        variant = next((v for v in self.variants if v.id == self.selected_variant_id), None)
+        variant = self._by_id.get(self.selected_variant_id)
         if not variant:
             return
 
@@ -396,7 +578,7 @@ class ResumeVariantsDialog(QDialog):
         layout = QVBoxLayout(dialog)
 
         label = QLabel(f"Notes for: {variant.variant_name or f'Variant {variant.variant_number}'}")
-        label.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
+        label.setStyleSheet(_NOTES_LABEL_CSS)
         layout.addWidget(label)
 
         notes_edit = QTextEdit()
@@ -423,7 +605,7 @@ class ResumeVariantsDialog(QDialog):
                     variant_id=self.selected_variant_id,
                     notes=new_notes
                 )
-                self._load_variants()
+                self.variants_model.refresh_variant(variant)
                 self.variant_updated.emit(self.selected_variant_id)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to update notes: {e}")
@@ -433,11 +615,12 @@ class ResumeVariantsDialog(QDialog):
         if not self.selected_variant_id:
             return
 
-        variant = next((v for v in self.variants if v.id == self.selected_variant_id), None)
+        variant = self._by_id.get(self.selected_variant_id)
         if not variant:
             return
 
-        current_name = variant.variant_name or f"Variant {variant.variant_number}"
+        old_name = variant.variant_name
+        current_name = old_name or f"Variant {variant.variant_number}"
 
         new_name, ok = QInputDialog.getText(
             self,
@@ -450,7 +633,7 @@ class ResumeVariantsDialog(QDialog):
             new_name = new_name.strip()
 
             # Check for duplicate
-            if any(v.variant_name == new_name and v.id != self.selected_variant_id for v in self.variants):
+            if new_name in self._names and new_name != variant.variant_name:
                 QMessageBox.warning(
                     self,
                     "Duplicate Name",
@@ -463,7 +646,9 @@ class ResumeVariantsDialog(QDialog):
                     variant_id=self.selected_variant_id,
                     variant_name=new_name
                 )
-                self._load_variants()
+                self._names.discard(old_name)
+                self._names.add(new_name)
+                self.variants_model.refresh_variant(variant)
                 self.variant_updated.emit(self.selected_variant_id)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to rename variant: {e}")
@@ -473,13 +658,18 @@ class ResumeVariantsDialog(QDialog):
         if not self.selected_variant_id:
             return
 
-        variant = next((v for v in self.variants if v.id == self.selected_variant_id), None)
+        variant = self._by_id.get(self.selected_variant_id)
         if not variant:
             return
 
+        previous_primary = [v for v in self.variants if v.is_primary and v is not variant]
+
         try:
             self.variant_service.mark_as_primary(self.selected_variant_id)
-            self._load_variants()
+            self._primary_variant = variant
+            for changed in (*previous_primary, variant):
+                self.variants_model.refresh_variant(changed)
+            self._on_variant_selected()
             self.variant_updated.emit(self.selected_variant_id)
 
             QMessageBox.information(
@@ -502,16 +692,31 @@ class ResumeVariantsDialog(QDialog):
 
         # For now, compare the first 2 or 3 variants
         # TODO: Add variant selector dialog
-        variant_ids = [v.id for v in self.variants[:min(3, len(self.variants))]]
+        compared = self.variants[:min(3, len(self.variants))]
+        variant_ids = [v.id for v in compared]
 
         try:
-            comparison = self.variant_service.compare_variants(variant_ids)
-            self._show_comparison_dialog(comparison)
+            # Reuse the formatted text while none of the variants has changed
+            cache_key = tuple((v.id, v.updated_at) for v in compared)
+            comparison_text = self._comparison_cache.get(cache_key)
+            if comparison_text is None:
+                comparison = self.variant_service.compare_variants(variant_ids)
+                comparison_text = self._format_comparison(comparison)
+                self._comparison_cache[cache_key] = comparison_text
+            self._show_comparison_dialog(comparison_text)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to compare variants: {e}")
 
-    def _show_comparison_dialog(self, comparison: VariantComparison):
+    def _show_comparison_dialog(self, comparison_text: str):
         """Show the comparison results in a dialog."""
+        if self._comparison_dialog is None:
+            self._comparison_dialog = self._build_comparison_dialog()
+
+        self._comparison_text_edit.setPlainText(comparison_text)
+        self._comparison_dialog.exec()
+
+    def _build_comparison_dialog(self) -> QDialog:
+        """Build the comparison dialog once; later comparisons reuse it."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Variant Comparison")
         dialog.setMinimumWidth(700)
@@ -520,15 +725,13 @@ class ResumeVariantsDialog(QDialog):
         layout = QVBoxLayout(dialog)
 
         title = QLabel("Variant Comparison")
-        title.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title.setStyleSheet(_COMPARISON_TITLE_CSS)
         layout.addWidget(title)
 
         # Create comparison text
         text_edit = QTextEdit()
         text_edit.setReadOnly(True)
-
-        comparison_text = self._format_comparison(comparison)
-        text_edit.setPlainText(comparison_text)
+        self._comparison_text_edit = text_edit
 
         layout.addWidget(text_edit)
 
@@ -542,54 +745,55 @@ class ResumeVariantsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-        dialog.exec()
+        return dialog
 
     def _format_comparison(self, comparison: VariantComparison) -> str:
         """Format comparison data as text."""
-        lines = []
+        lines: List[str] = []
+        append = lines.append
 
-        lines.append("=" * 80)
-        lines.append("RESUME VARIANT COMPARISON")
-        lines.append("=" * 80)
-        lines.append("")
+        append(_RULE)
+        append("RESUME VARIANT COMPARISON")
+        append(_RULE)
+        append("")
 
         # Variant summary
-        lines.append("VARIANTS COMPARED:")
+        append("VARIANTS COMPARED:")
         for info in comparison.metadata["variants_info"]:
             primary_marker = " [PRIMARY]" if info["is_primary"] else ""
-            lines.append(f"  • {info['name']} (#{info['variant_number']}){primary_marker}")
-            lines.append(f"    Match Score: {info['match_score']}, Coverage: {(info['coverage_percentage'] or 0) * 100:.1f}%")
-        lines.append("")
+            append(f"  • {info['name']} (#{info['variant_number']}){primary_marker}")
+            append(f"    Match Score: {info['match_score']}, Coverage: {_percent(info['coverage_percentage'])}")
+        append("")
 
         # Accomplishment comparison
-        lines.append("-" * 80)
-        lines.append("ACCOMPLISHMENT COMPARISON:")
-        lines.append("-" * 80)
+        append(_THIN_RULE)
+        append("ACCOMPLISHMENT COMPARISON:")
+        append(_THIN_RULE)
 
         acc_diff = comparison.accomplishment_diffs
-        lines.append(f"Common accomplishments across all variants: {len(acc_diff['common_accomplishments'])}")
-        lines.append(f"Total unique accomplishments: {acc_diff['total_unique_accomplishments']}")
-        lines.append("")
+        append(f"Common accomplishments across all variants: {len(acc_diff['common_accomplishments'])}")
+        append(f"Total unique accomplishments: {acc_diff['total_unique_accomplishments']}")
+        append("")
 
         for var_diff in acc_diff["by_variant"]:
-            lines.append(f"{var_diff['variant_name']}:")
-            lines.append(f"  Total accomplishments: {var_diff['total_accomplishments']}")
-            lines.append(f"  Unique to this variant: {var_diff['unique_count']}")
-        lines.append("")
+            append(f"{var_diff['variant_name']}:")
+            append(f"  Total accomplishments: {var_diff['total_accomplishments']}")
+            append(f"  Unique to this variant: {var_diff['unique_count']}")
+        append("")
 
         # Skill coverage comparison
-        lines.append("-" * 80)
-        lines.append("SKILL COVERAGE COMPARISON:")
-        lines.append("-" * 80)
+        append(_THIN_RULE)
+        append("SKILL COVERAGE COMPARISON:")
+        append(_THIN_RULE)
 
         for var_skill in comparison.skill_diffs["by_variant"]:
-            lines.append(f"{var_skill['variant_name']}:")
-            lines.append(f"  Coverage: {(var_skill['coverage_percentage'] or 0) * 100:.1f}%")
-            lines.append(f"  Covered skills: {len(var_skill['covered_skills'])}")
-            lines.append(f"  Missing skills: {len(var_skill['missing_skills'])}")
+            append(f"{var_skill['variant_name']}:")
+            append(f"  Coverage: {_percent(var_skill['coverage_percentage'])}")
+            append(f"  Covered skills: {len(var_skill['covered_skills'])}")
+            append(f"  Missing skills: {len(var_skill['missing_skills'])}")
 
-        lines.append("")
-        lines.append("=" * 80)
+        append("")
+        append(_RULE)
 
         return "\n".join(lines)
 
@@ -606,7 +810,7 @@ class ResumeVariantsDialog(QDialog):
             )
             return
 
-        variant = next((v for v in self.variants if v.id == self.selected_variant_id), None)
+        variant = self._by_id.get(self.selected_variant_id)
         if not variant:
             return
 
@@ -623,9 +827,14 @@ class ResumeVariantsDialog(QDialog):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
+                was_primary = variant.is_primary
                 self.variant_service.delete_variant(self.selected_variant_id)
                 deleted_id = self.selected_variant_id
-                self._load_variants()
+                self._variant_removed(variant)
+                if was_primary:
+                    # The service promoted another variant to primary
+                    for remaining in self.variants:
+                        self.variants_model.refresh_variant(remaining)
                 self.variant_deleted.emit(deleted_id)
 
                 QMessageBox.information(
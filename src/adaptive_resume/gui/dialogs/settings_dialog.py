@@ -1,13 +1,186 @@
 """Settings dialog for application preferences."""
 
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QLineEdit, 
     QPushButton, QLabel, QCheckBox, QGroupBox, QHBoxLayout,
     QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from adaptive_resume.config.settings import Settings
 
+if TYPE_CHECKING:
+    import anthropic
+
+logger = logging.getLogger(__name__)
+
+
+# Static label text and stylesheets, shared by every dialog instance
+_INFO_TEXT = (
+    "Enable AI-powered bullet point enhancement using Claude.\n"
+    "You'll need your own Anthropic API key.\n"
+    "Get one at: https://console.anthropic.com/"
+)
+_ENABLE_NOTE_TEXT = (
+    "Note: Your API key is saved whether or not AI enhancement is enabled.\n"
+    "You can enable/disable this feature at any time without re-entering your key."
+)
+_SECURITY_NOTE_TEXT = (
+    "🔒 Your API key is encrypted and stored securely on your computer.\n"
+    "It is never transmitted except to Anthropic's API when you use AI enhancement."
+)
+_INFO_CSS = "color: #ccc; padding: 10px;"
+_BOLD_CSS = "font-weight: bold;"
+_ENABLE_CHECKBOX_CSS = "font-weight: bold; margin-top: 15px;"
+_ENABLE_NOTE_CSS = "color: #888; font-size: 11px; margin-left: 20px;"
+_SECURITY_NOTE_CSS = (
+    "color: #888; font-size: 11px; padding: 10px; background: #1a2332; "
+    "border-radius: 4px; margin-top: 10px;"
+)
+
+# Status label styles
+_STYLE_OK = "color: #4ade80;"
+_STYLE_ERR = "color: #ff4444;"
+_STYLE_WARN = "color: orange;"
+_STYLE_INFO = "color: #4a90e2;"
+
+# Shortest text accepted as an API key
+_MIN_KEY_LENGTH = 10
+
+# How long the saved confirmation stays readable before the dialog closes
+_SAVED_CLOSE_DELAY_MS = 1200
+
+# Shown in the key field in place of a stored key
+_MASKED_PLACEHOLDER = "\u2022" * 16
+
+_SUCCESS_MESSAGE = "✅ Connection successful! API key is valid."
+_INVALID_KEY_MESSAGE = "❌ Invalid API key. Please check and try again."
+_TIMEOUT_MESSAGE = "❌ Connection timed out. Please try again."
+
+# Test clients fail fast: one attempt, bounded by this many seconds. This
+# budget is only for validation; enhancement services build their own clients.
+_TEST_REQUEST_TIMEOUT = 5.0
+
+# Backstop for a test that still has not answered (e.g. stuck connecting)
+_TEST_TIMEOUT_MS = 15000
+
+# Recent test outcomes keyed by a SHA-256 of the key (never the key itself):
+# digest -> (time.monotonic() when tested, valid). Rejected keys expire
+# sooner so a user can retry shortly after fixing the key.
+_VALIDATION_CACHE: Dict[str, Tuple[float, bool]] = {}
+_VALID_TTL = 300.0
+_INVALID_TTL = 30.0
+
+
+def _key_digest(api_key: str) -> str:
+    """Return the cache key for an API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _cached_validation(api_key: str) -> Optional[bool]:
+    """Return a still-fresh test outcome for ``api_key``, if any."""
+    entry = _VALIDATION_CACHE.get(_key_digest(api_key))
+    if entry is None:
+        return None
+    tested_at, valid = entry
+    ttl = _VALID_TTL if valid else _INVALID_TTL
+    if time.monotonic() - tested_at >= ttl:
+        return None
+    return valid
+
+
+_anthropic = None
+
+
+def _get_anthropic():
+    """Import the Anthropic SDK on first use and reuse the module afterwards."""
+    global _anthropic
+    if _anthropic is None:
+        import anthropic
+        _anthropic = anthropic
+    return _anthropic
+
+
+# Anthropic clients keyed like _VALIDATION_CACHE, most recently used last.
+# Reusing a client keeps its connection pool, so repeat tests skip the
+# TCP/TLS setup. Workers read this from their own threads.
+_CLIENT_CACHE: "OrderedDict[str, anthropic.Anthropic]" = OrderedDict()
+_CLIENT_CACHE_SIZE = 4
+_client_lock = threading.Lock()
+
+
+def _get_client(api_key: str):
+    """Return a cached Anthropic client for ``api_key``, creating it if needed."""
+    digest = _key_digest(api_key)
+    with _client_lock:
+        client = _CLIENT_CACHE.get(digest)
+        if client is not None:
+            _CLIENT_CACHE.move_to_end(digest)
+            return client
+    client = _get_anthropic().Anthropic(
+        api_key=api_key, timeout=_TEST_REQUEST_TIMEOUT, max_retries=0
+    )
+    with _client_lock:
+        _CLIENT_CACHE[digest] = client
+        while len(_CLIENT_CACHE) > _CLIENT_CACHE_SIZE:
+            _CLIENT_CACHE.popitem(last=False)
+    return client
+
+
+def _forget_keys():
+    """Drop cached test results and clients after the stored key changes."""
+    _VALIDATION_CACHE.clear()
+    with _client_lock:
+        _CLIENT_CACHE.clear()
+
+
+# Test workers started by any dialog; holding a reference keeps Qt from
+# destroying a thread mid-request if its dialog closes first. Finished
+# workers are dropped when the next test starts.
+_active_workers = set()
+
+
+class ApiKeyTestWorker(QThread):
+    """Background worker that checks an Anthropic API key with a minimal request."""
+
+    finished = pyqtSignal(bool, str)  # Emits (success, status message)
+
+    def __init__(self, api_key: str):
+        super().__init__()
+        self.api_key = api_key
+
+    def run(self):
+        """Make a minimal API call and report whether it succeeded."""
+        try:
+            client = _get_client(self.api_key)
+
+            # Make a minimal API call to test
+            response = client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=10,
+                messages=[{"role": "user", "content": "Hi"}]
+            )
+
+            if response.content:
+                _VALIDATION_CACHE[_key_digest(self.api_key)] = (time.monotonic(), True)
+                self.finished.emit(True, _SUCCESS_MESSAGE)
+            else:
+                self.finished.emit(False, "❌ Connection failed. Invalid response.")
+
+        except Exception as e:
+            error_msg = str(e)
+            if "api_key" in error_msg.lower() or "authentication" in error_msg.lower():
+                _VALIDATION_CACHE[_key_digest(self.api_key)] = (time.monotonic(), False)
+                self.finished.emit(False, _INVALID_KEY_MESSAGE)
+            else:
+                self.finished.emit(False, f"❌ Connection failed: {error_msg[:100]}")
+
 
 class SettingsDialog(QDialog):
     """Dialog for managing application settings."""
@@ -20,7 +193,11 @@ class SettingsDialog(QDialog):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.settings = Settings()
+        self.settings = Settings.instance()
+        self._test_worker = None
+        self._test_timer = QTimer(self)
+        self._test_timer.setSingleShot(True)
+        self._test_timer.timeout.connect(self._on_test_timeout)
         self.setWindowTitle("Settings")
         self.setModal(True)
         self.setMinimumWidth(600)
@@ -30,6 +207,15 @@ class SettingsDialog(QDialog):
     
     def _create_ui(self):
         """Create the user interface."""
+        # Suspend repaints until every widget is in place
+        self.setUpdatesEnabled(False)
+        try:
+            self._create_widgets()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _create_widgets(self):
+        """Create the dialog's widgets and layouts."""
         layout = QVBoxLayout(self)
         
         # AI Enhancement Section
@@ -37,13 +223,9 @@ class SettingsDialog(QDialog):
         ai_layout = QVBoxLayout()
         
         # Info text
-        info_label = QLabel(
-            "Enable AI-powered bullet point enhancement using Claude.\n"
-            "You'll need your own Anthropic API key.\n"
-            "Get one at: https://console.anthropic.com/"
-        )
+        info_label = QLabel(_INFO_TEXT)
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: #ccc; padding: 10px;")
+        info_label.setStyleSheet(_INFO_CSS)
         ai_layout.addWidget(info_label)
         
         # API Key input (moved above checkbox)
@@ -51,21 +233,22 @@ class SettingsDialog(QDialog):
         form.setSpacing(15)
         
         api_key_label = QLabel("Anthropic API Key:")
-        api_key_label.setStyleSheet("font-weight: bold;")
+        api_key_label.setStyleSheet(_BOLD_CSS)
         
         self.api_key_input = QLineEdit()
         self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.api_key_input.setPlaceholderText("sk-ant-api03-...")
         self.api_key_input.setMinimumWidth(400)
+        self.api_key_input.setMaxLength(256)
         
         form.addRow(api_key_label, self.api_key_input)
         ai_layout.addLayout(form)
         
         # Test connection button
-        test_btn = QPushButton("Test Connection")
-        test_btn.setMaximumWidth(150)
-        test_btn.clicked.connect(self._test_api_key)
-        ai_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("Test Connection")
+        self.test_btn.setMaximumWidth(150)
+        self.test_btn.clicked.connect(self._test_api_key)
+        ai_layout.addWidget(self.test_btn)
         
         # Status label
         self.status_label = QLabel("")
@@ -74,24 +257,18 @@ class SettingsDialog(QDialog):
         
         # Enable checkbox (moved below API key input)
         self.ai_enabled_cb = QCheckBox("Enable AI Enhancement")
-        self.ai_enabled_cb.setStyleSheet("font-weight: bold; margin-top: 15px;")
+        self.ai_enabled_cb.setStyleSheet(_ENABLE_CHECKBOX_CSS)
         ai_layout.addWidget(self.ai_enabled_cb)
         
-        enable_note = QLabel(
-            "Note: Your API key is saved whether or not AI enhancement is enabled.\n"
-            "You can enable/disable this feature at any time without re-entering your key."
-        )
+        enable_note = QLabel(_ENABLE_NOTE_TEXT)
         enable_note.setWordWrap(True)
-        enable_note.setStyleSheet("color: #888; font-size: 11px; margin-left: 20px;")
+        enable_note.setStyleSheet(_ENABLE_NOTE_CSS)
         ai_layout.addWidget(enable_note)
         
         # Security note
-        security_note = QLabel(
-            "🔒 Your API key is encrypted and stored securely on your computer.\n"
-            "It is never transmitted except to Anthropic's API when you use AI enhancement."
-        )
+        security_note = QLabel(_SECURITY_NOTE_TEXT)
         security_note.setWordWrap(True)
-        security_note.setStyleSheet("color: #888; font-size: 11px; padding: 10px; background: #1a2332; border-radius: 4px; margin-top: 10px;")
+        security_note.setStyleSheet(_SECURITY_NOTE_CSS)
         ai_layout.addWidget(security_note)
         
         ai_group.setLayout(ai_layout)
@@ -107,26 +284,34 @@ class SettingsDialog(QDialog):
         clear_btn.clicked.connect(self._clear_api_key)
         button_layout.addWidget(clear_btn)
         
-        save_btn = QPushButton("Save")
-        save_btn.setDefault(True)
-        save_btn.clicked.connect(self._on_save)
-        button_layout.addWidget(save_btn)
+        self.save_btn = QPushButton("Save")
+        self.save_btn.setDefault(True)
+        self.save_btn.clicked.connect(self._on_save)
+        button_layout.addWidget(self.save_btn)
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
         layout.addLayout(button_layout)
+        
+        # Only allow saving once a typed key is long enough (or none is typed)
+        self.api_key_input.textChanged.connect(self._on_api_key_changed)
+    
+    def _on_api_key_changed(self, text: str):
+        """Enable Save only when the key field holds something savable."""
+        self.save_btn.setEnabled(
+            len(text) == 0 or len(text) >= _MIN_KEY_LENGTH or text == _MASKED_PLACEHOLDER
+        )
     
     def _load_settings(self):
         """Load current settings into UI."""
         # Load the enable checkbox state
         self.ai_enabled_cb.setChecked(self.settings.ai_enabled)
         
-        # Load API key (if exists, show masked)
-        api_key = self.settings.get_api_key()
-        if api_key:
-            self.api_key_input.setText("••••••••••••••••")
+        # Show a masked key if one is stored; no need to decrypt it here
+        if self.settings.has_api_key():
+            self.api_key_input.setText(_MASKED_PLACEHOLDER)
             self.api_key_input.setPlaceholderText("(API key is set)")
     
     def _test_api_key(self):
@@ -134,48 +319,54 @@ class SettingsDialog(QDialog):
         api_key = self.api_key_input.text().strip()
         
         # If showing masked text, get actual key from storage
-        if api_key == "••••••••••••••••":
+        if api_key == _MASKED_PLACEHOLDER:
             api_key = self.settings.get_api_key()
         
-        if not api_key or len(api_key) < 10:
-            self.status_label.setText("⚠️ Please enter an API key to test")
-            self.status_label.setStyleSheet("color: orange;")
+        if not api_key or len(api_key) < _MIN_KEY_LENGTH:
+            self._set_status("⚠️ Please enter an API key to test", _STYLE_WARN)
             return
         
-        self.status_label.setText("🔄 Testing connection...")
-        self.status_label.setStyleSheet("color: #4a90e2;")
+        # Reuse a recent result for the same key instead of another round-trip
+        cached = _cached_validation(api_key)
+        if cached is not None:
+            self._show_test_result(cached, _SUCCESS_MESSAGE if cached else _INVALID_KEY_MESSAGE)
+            return
         
-        # Process events to show loading message
-        from PyQt6.QtCore import QCoreApplication
-        QCoreApplication.processEvents()
+        self._set_status("🔄 Testing connection...", _STYLE_INFO)
+        self.test_btn.setEnabled(False)
         
-        # Test with actual API call
-        try:
-            import anthropic
-            
-            client = anthropic.Anthropic(api_key=api_key)
-            
-            # Make a minimal API call to test
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=10,
-                messages=[{"role": "user", "content": "Hi"}]
-            )
-            
-            if response.content:
-                self.status_label.setText("✅ Connection successful! API key is valid.")
-                self.status_label.setStyleSheet("color: #4ade80;")
-            else:
-                self.status_label.setText("❌ Connection failed. Invalid response.")
-                self.status_label.setStyleSheet("color: #ff4444;")
-                
-        except Exception as e:
-            error_msg = str(e)
-            if "api_key" in error_msg.lower() or "authentication" in error_msg.lower():
-                self.status_label.setText("❌ Invalid API key. Please check and try again.")
-            else:
-                self.status_label.setText(f"❌ Connection failed: {error_msg[:100]}")
-            self.status_label.setStyleSheet("color: #ff4444;")
+        # Test with actual API call off the GUI thread
+        worker = ApiKeyTestWorker(api_key)
+        worker.finished.connect(self._on_test_result)
+        _active_workers.difference_update([w for w in _active_workers if w.isFinished()])
+        _active_workers.add(worker)
+        self._test_worker = worker
+        worker.start()
+        self._test_timer.start(_TEST_TIMEOUT_MS)
+    
+    def _on_test_result(self, success: bool, message: str):
+        """Show the outcome of a background API key test."""
+        if self.sender() is not self._test_worker:
+            return  # Result of a test that already timed out
+        self._test_timer.stop()
+        self._test_worker = None
+        self._show_test_result(success, message)
+    
+    def _on_test_timeout(self):
+        """Give up on a connection test that has not answered in time."""
+        self._test_worker = None
+        self._show_test_result(False, _TIMEOUT_MESSAGE)
+    
+    def _show_test_result(self, success: bool, message: str):
+        """Update the status label and re-enable testing."""
+        self.test_btn.setEnabled(True)
+        self._set_status(message, _STYLE_OK if success else _STYLE_ERR)
+    
+    def _set_status(self, text: str, style: str):
+        """Show a status message, restyling the label only if the style changed."""
+        self.status_label.setText(text)
+        if self.status_label.styleSheet() != style:
+            self.status_label.setStyleSheet(style)
     
     def _clear_api_key(self):
         """Clear the stored API key."""
@@ -189,10 +380,10 @@ class SettingsDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.settings.clear_api_key()
+            _forget_keys()
             self.api_key_input.clear()
             self.api_key_input.setPlaceholderText("sk-ant-api03-...")
-            self.status_label.setText("✅ API key cleared.")
-            self.status_label.setStyleSheet("color: #4ade80;")
+            self._set_status("✅ API key cleared.", _STYLE_OK)
     
     def _on_save(self):
         """Save settings."""
@@ -200,16 +391,17 @@ class SettingsDialog(QDialog):
         
         try:
             # Save API key if provided (independent of checkbox)
-            if api_key and api_key != "••••••••••••••••":
+            if api_key and api_key != _MASKED_PLACEHOLDER:
                 # User entered a new key
-                if len(api_key) >= 10:
-                    print(f"[DEBUG] Saving new API key (length: {len(api_key)})")
+                if len(api_key) >= _MIN_KEY_LENGTH:
+                    logger.debug("Saving new API key (length: %d)", len(api_key))
                     self.settings.set_api_key(api_key)
+                    _forget_keys()
                 else:
                     QMessageBox.warning(
                         self,
                         "Invalid API Key",
-                        "API key must be at least 10 characters long."
+                        f"API key must be at least {_MIN_KEY_LENGTH} characters long."
                     )
                     return
             # If masked text (••••••), key is already saved, do nothing
@@ -218,26 +410,21 @@ class SettingsDialog(QDialog):
             self.settings.set('ai_enhancement_enabled', self.ai_enabled_cb.isChecked())
             self.settings.save()
             
-            # Show success message
-            msg = "Your settings have been saved successfully.\n\n"
-            if self.settings.get_api_key():
-                msg += "✓ API key is stored (encrypted)\n"
+            # Confirm inline, then close once the summary has had time to be read
+            lines = ["✅ Settings saved."]
+            if self.settings.has_api_key():
+                lines.append("✓ API key is stored (encrypted)")
             if self.ai_enabled_cb.isChecked():
-                msg += "✓ AI enhancement is enabled"
+                lines.append("✓ AI enhancement is enabled")
             else:
-                msg += "✓ AI enhancement is disabled"
-            
-            QMessageBox.information(
-                self,
-                "Settings Saved",
-                msg
-            )
-            self.accept()
+                lines.append("✓ AI enhancement is disabled")
+            self._set_status("\n".join(lines), _STYLE_OK)
+            self.save_btn.setEnabled(False)
+            self.api_key_input.setEnabled(False)
+            QTimer.singleShot(_SAVED_CLOSE_DELAY_MS, self.accept)
             
         except Exception as e:
-            print(f"[ERROR] Failed to save settings: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Failed to save settings")
             
             QMessageBox.critical(
                 self,
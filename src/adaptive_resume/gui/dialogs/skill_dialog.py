@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from decimal import Decimal
 
 try:
@@ -16,7 +16,10 @@ try:
         QDoubleSpinBox,
         QVBoxLayout,
         QMessageBox,
+        QApplication,
     )
+    from PyQt6.QtCore import QSignalBlocker
+    from PyQt6.QtGui import QStandardItem, QStandardItemModel
 except ImportError as exc:  # pragma: no cover
     raise ImportError("PyQt6 is required to use the GUI components") from exc
 
@@ -24,6 +27,30 @@ from adaptive_resume.services.skill_database_service import SkillDatabaseService
 from adaptive_resume.gui.widgets import SkillAutocompleteWidget
 
 
+_AUTOCOMPLETE_PLACEHOLDER = "Type to search skills... (e.g., Python, Leadership, AWS)"
+
+_shared_models: Optional[Tuple[QStandardItemModel, QStandardItemModel]] = None
+
+
+def _get_models() -> Tuple[QStandardItemModel, QStandardItemModel]:
+    """Return the (category, proficiency) combo models shared by all dialogs.
+
+    The item lists never change, so they are built once per application
+    instead of on every dialog open.
+    """
+    global _shared_models
+    if _shared_models is None:
+        app = QApplication.instance()
+        models = []
+        for values in (SkillDialog.CATEGORIES, SkillDialog.PROFICIENCY_LEVELS):
+            model = QStandardItemModel(app)
+            for value in values:
+                model.appendRow(QStandardItem(value))
+            models.append(model)
+        _shared_models = tuple(models)
+    return _shared_models
+
+
 @dataclass
 class SkillDialogResult:
     """Return payload describing skill data from the dialog."""
@@ -35,7 +62,12 @@ class SkillDialogResult:
 
 
 class SkillDialog(QDialog):
-    """Dialog used to gather skill information."""
+    """Dialog used to gather skill information.
+
+    With ``use_autocomplete`` (the default) the skill name field gains
+    database-backed suggestions once the user starts typing; it stays a
+    plain text field when disabled or if the skill database cannot load.
+    """
 
     PROFICIENCY_LEVELS = ['', 'Beginner', 'Intermediate', 'Advanced', 'Expert']
 
@@ -51,6 +83,10 @@ class SkillDialog(QDialog):
         'Other',
     ]
 
+    # Combo row for each entry, replacing findText scans over the models
+    _CATEGORY_INDEX = {name: i for i, name in enumerate(CATEGORIES)}
+    _PROFICIENCY_INDEX = {name: i for i, name in enumerate(PROFICIENCY_LEVELS)}
+
     def __init__(self, parent=None, skill: Optional[dict] = None, use_autocomplete: bool = True) -> None:
         super().__init__(parent)
         self.setWindowTitle("Skill")
@@ -58,50 +94,51 @@ class SkillDialog(QDialog):
         self.use_autocomplete = use_autocomplete
         self._selected_skill_id = None  # Track selected skill from database
 
-        # Initialize skill database service for autocomplete
+        # The skill database service and autocomplete widget are created on
+        # the first keystroke in the skill name (see _install_autocomplete)
         self._skill_db_service = None
-        if self.use_autocomplete:
-            try:
-                self._skill_db_service = SkillDatabaseService()
-            except Exception:
-                # Fallback to regular input if skill database fails
-                self.use_autocomplete = False
+        self.skill_name_autocomplete = None
 
         self._build_form()
         if skill:
             self._load_skill(skill)
 
     def _build_form(self) -> None:
+        # Suspend repaints until every field is in place
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_fields()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_fields(self) -> None:
         layout = QVBoxLayout(self)
         form = QFormLayout()
+        self._form = form
 
-        # Skill name (required) - use autocomplete if available
-        if self.use_autocomplete and self._skill_db_service:
-            self.skill_name_autocomplete = SkillAutocompleteWidget(
-                skill_service=self._skill_db_service,
-                placeholder="Type to search skills... (e.g., Python, Leadership, AWS)"
-            )
-            self.skill_name_autocomplete.skill_selected.connect(self._on_skill_selected)
-            # Create a simple QLineEdit for compatibility (will be hidden)
-            self.skill_name = QLineEdit()
-            self.skill_name.setVisible(False)
-            form.addRow("Skill Name *", self.skill_name_autocomplete)
+        # Skill name (required). With autocomplete, this plain field stands in
+        # until the user types, then is replaced by the autocomplete widget.
+        self.skill_name = QLineEdit()
+        if self.use_autocomplete:
+            self.skill_name.setPlaceholderText(_AUTOCOMPLETE_PLACEHOLDER)
+            self.skill_name.textEdited.connect(self._install_autocomplete)
         else:
-            # Fallback to regular input
-            self.skill_name = QLineEdit()
             self.skill_name.setPlaceholderText("e.g., Python, Leadership, AWS")
-            self.skill_name_autocomplete = None
-            form.addRow("Skill Name *", self.skill_name)
+        form.addRow("Skill Name *", self.skill_name)
+
+        category_model, proficiency_model = _get_models()
 
         # Category (optional, dropdown)
         self.category = QComboBox()
         self.category.setEditable(True)  # Allow custom categories
-        self.category.addItems(self.CATEGORIES)
+        # The model is shared, so custom text must not be added to it
+        self.category.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.category.setModel(category_model)
         self.category.setPlaceholderText("Select or type a category")
 
         # Proficiency level (optional, dropdown)
         self.proficiency_level = QComboBox()
-        self.proficiency_level.addItems(self.PROFICIENCY_LEVELS)
+        self.proficiency_level.setModel(proficiency_model)
 
         # Years of experience (optional)
         self.years_experience = QDoubleSpinBox()
@@ -126,6 +163,41 @@ class SkillDialog(QDialog):
         self.buttons.rejected.connect(self.reject)
         layout.addWidget(self.buttons)
 
+    def _install_autocomplete(self) -> None:
+        """Swap the plain skill name field for the autocomplete widget."""
+        self.skill_name.textEdited.disconnect(self._install_autocomplete)
+        try:
+            self._skill_db_service = SkillDatabaseService()
+        except Exception:
+            # Fallback to regular input if skill database fails
+            self.use_autocomplete = False
+            self.skill_name.setPlaceholderText("e.g., Python, Leadership, AWS")
+            return
+
+        self.skill_name_autocomplete = SkillAutocompleteWidget(
+            skill_service=self._skill_db_service,
+            placeholder=_AUTOCOMPLETE_PLACEHOLDER
+        )
+        self.skill_name_autocomplete.skill_selected.connect(self._on_skill_selected)
+
+        # Carry over what has been typed so far and keep the cursor there
+        self.skill_name_autocomplete.set_text(self.skill_name.text())
+
+        row, _ = self._form.getWidgetPosition(self.skill_name)
+        self._form.removeWidget(self.skill_name)
+        self.skill_name.hide()
+        self.skill_name.deleteLater()
+        self.skill_name = None
+        self._form.setWidget(row, QFormLayout.ItemRole.FieldRole, self.skill_name_autocomplete)
+        self.skill_name_autocomplete.input_field.setFocus()
+
+    @property
+    def _skill_name_text(self) -> str:
+        """Skill name from whichever field is active."""
+        if self.skill_name_autocomplete:
+            return self.skill_name_autocomplete.text()
+        return self.skill_name.text()
+
     def _on_skill_selected(self, skill_name: str, skill_id: Optional[int]) -> None:
         """
         Handle skill selection from autocomplete.
@@ -135,16 +207,13 @@ class SkillDialog(QDialog):
         # Store the selected skill ID
         self._selected_skill_id = skill_id
 
-        # Update the hidden skill_name field for compatibility
-        self.skill_name.setText(skill_name)
-
         # If skill is from database, auto-populate category
         if skill_id is not None and self._skill_db_service:
             skill_details = self._skill_db_service.get_skill_details(skill_id)
             if skill_details:
                 # Set category
                 category = skill_details.category
-                index = self.category.findText(category)
+                index = self._CATEGORY_INDEX.get(category, -1)
                 if index >= 0:
                     self.category.setCurrentIndex(index)
                 else:
@@ -153,41 +222,38 @@ class SkillDialog(QDialog):
 
     def _load_skill(self, skill: dict) -> None:
         """Load existing skill data into the form."""
-        skill_name = skill.get("skill_name", "")
-
-        # Set skill name based on which widget is active
-        if self.skill_name_autocomplete:
-            self.skill_name_autocomplete.set_text(skill_name)
-        else:
+        # Nothing needs to react to the initial values, so load them silently
+        with (
+            QSignalBlocker(self.skill_name),
+            QSignalBlocker(self.category),
+            QSignalBlocker(self.proficiency_level),
+            QSignalBlocker(self.years_experience),
+        ):
+            skill_name = skill.get("skill_name", "")
+
+            # The autocomplete widget is not built until the user types
             self.skill_name.setText(skill_name)
 
-        # Always update hidden field
-        self.skill_name.setText(skill_name)
-
-        category = skill.get("category", "")
-        if category:
-            index = self.category.findText(category)
-            if index >= 0:
-                self.category.setCurrentIndex(index)
-            else:
-                self.category.setEditText(category)
+            category = skill.get("category", "")
+            if category:
+                index = self._CATEGORY_INDEX.get(category, -1)
+                if index >= 0:
+                    self.category.setCurrentIndex(index)
+                else:
+                    self.category.setEditText(category)
 
-        proficiency = skill.get("proficiency_level", "")
-        if proficiency:
-            index = self.proficiency_level.findText(proficiency)
-            if index >= 0:
-                self.proficiency_level.setCurrentIndex(index)
+            proficiency = skill.get("proficiency_level", "")
+            if proficiency:
+                index = self._PROFICIENCY_INDEX.get(proficiency, -1)
+                if index >= 0:
+                    self.proficiency_level.setCurrentIndex(index)
 
-        if skill.get("years_experience") is not None:
-            self.years_experience.setValue(float(skill["years_experience"]))
+            if skill.get("years_experience") is not None:
+                self.years_experience.setValue(float(skill["years_experience"]))
 
     def _validate_and_accept(self) -> None:
         """Validate form fields before accepting the dialog."""
-        # Get skill name from appropriate widget
-        if self.skill_name_autocomplete:
-            skill_text = self.skill_name_autocomplete.text().strip()
-        else:
-            skill_text = self.skill_name.text().strip()
+        skill_text = self._skill_name_text.strip()
 
         # Validate required fields
         if not skill_text:
@@ -202,20 +268,12 @@ class SkillDialog(QDialog):
                 self.skill_name.setFocus()
             return
 
-        # Update hidden field if using autocomplete
-        if self.skill_name_autocomplete:
-            self.skill_name.setText(skill_text)
-
         # All validation passed, accept the dialog
         self.accept()
 
     def get_result(self) -> SkillDialogResult:
         """Return the captured skill data."""
-        # Get skill name from appropriate widget
-        if self.skill_name_autocomplete:
-            skill_text = self.skill_name_autocomplete.text().strip()
-        else:
-            skill_text = self.skill_name.text().strip()
+        skill_text = self._skill_name_text.strip()
 
         # Years experience is None if 0.0 (special value)
         years_exp = None
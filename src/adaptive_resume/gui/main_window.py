@@ -4,13 +4,17 @@ from __future__ import annotations
 
 __all__ = ["MainWindow"]
 
+import json
 import logging
-from typing import Optional
+from dataclasses import asdict
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
 try:  # pragma: no cover - import guard depends on platform runtime
-    from PyQt6.QtCore import Qt
+    from PyQt6.QtCore import Qt, QSignalBlocker, QThread, QTimer, pyqtSignal
     from PyQt6.QtGui import QAction
     from PyQt6.QtWidgets import (
         QMenuBar,
@@ -31,7 +35,11 @@ try:  # pragma: no cover - import guard depends on platform runtime
 except Exception as exc:  # pragma: no cover - handled during runtime import
     raise ImportError("PyQt6 is required to use the GUI components") from exc
 
-from adaptive_resume.models import Profile, BulletPoint
+from sqlalchemy.orm import Session
+
+from adaptive_resume.config.settings import Settings
+from adaptive_resume.gui.database_manager import DatabaseManager
+from adaptive_resume.models import Profile, BulletPoint, JobPosting, TailoredResumeModel
 from adaptive_resume.models.base import DEFAULT_PROFILE_ID
 from adaptive_resume.services.job_service import JobService
 from adaptive_resume.services.profile_service import ProfileService
@@ -55,6 +63,7 @@ from .dialogs import (
 )
 from .widgets import NavigationMenu
 from .screens import (
+    BaseScreen,
     DashboardScreen,
     ProfileManagementScreen,
     CompaniesRolesScreen,
@@ -69,9 +78,186 @@ from .screens import (
 )
 
 
+# Screen signals that only navigate elsewhere: screen id -> (signal, target id)
+_NAV_SIGNALS = {
+    "dashboard": (
+        ("navigate_to_upload", "upload"),
+        ("navigate_to_companies", "companies"),
+        ("navigate_to_general", "general"),
+    ),
+    "results": (
+        ("start_over_requested", "upload"),
+    ),
+}
+
+# Quiet period before a scheduled screen refresh runs, so a burst of edits
+# reloads each screen once
+_REFRESH_DEBOUNCE_MS = 50
+
+# Dialog results compared after every exec(), resolved once at import
+_ACCEPTED = int(QDialog.DialogCode.Accepted)
+_YES = QMessageBox.StandardButton.Yes
+
+
+class _LazyScreen:
+    """Attribute that returns a MainWindow screen, building it on first access.
+
+    The screen id is the attribute name without its ``_screen`` suffix.
+    Assigning the attribute on an instance overrides the lookup.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.screen_id = name.removesuffix("_screen")
+
+    def __get__(self, window, owner=None):
+        if window is None:
+            return self
+        return window._get_screen(self.screen_id)
+
+
+def _dumps(value) -> str:
+    """Serialize ``value`` to JSON, skipping the encoder for empty lists and dicts."""
+    if not value and type(value) in (list, dict):
+        return "[]" if type(value) is list else "{}"
+    return json.dumps(value)
+
+
+class BulletUpdateWorker(QThread):
+    """Background worker that saves new bullet point content.
+
+    Uses its own session on the GUI session's engine, since SQLAlchemy
+    sessions must not be shared across threads.
+    """
+
+    finished = pyqtSignal(int)  # ID of the bullet's job
+    error = pyqtSignal(str)  # Error message
+
+    def __init__(self, bind, bullet_id: int, content: str):
+        super().__init__()
+        self.bind = bind
+        self.bullet_id = bullet_id
+        self.content = content
+
+    def run(self):
+        """Write the new content and commit."""
+        session = Session(bind=self.bind)
+        try:
+            bullet = JobService(session).update_bullet_point(self.bullet_id, content=self.content)
+            self.finished.emit(bullet.job_id)
+        except Exception as e:
+            session.rollback()
+            self.error.emit(str(e))
+        finally:
+            session.close()
+
+
+class TailoredResumePersistWorker(QThread):
+    """Background worker that saves a tailored resume and its job posting.
+
+    Uses its own session on the GUI session's engine, since SQLAlchemy
+    sessions must not be shared across threads.
+    """
+
+    finished = pyqtSignal(object, int, int)  # TailoredResume, job posting ID, resume ID
+    error = pyqtSignal(str)  # Error message
+
+    def __init__(self, bind, tailored_resume):
+        super().__init__()
+        self.bind = bind
+        self.tailored_resume = tailored_resume
+
+    def run(self):
+        """Save the job posting if it is new, then the tailored resume."""
+        session = Session(bind=self.bind)
+        try:
+            # First, save the JobPosting if it doesn't exist
+            job_posting_id = self.tailored_resume.job_posting_id
+            if job_posting_id is None:
+                # Create and save a new job posting with all metadata
+                job_posting = JobPosting(
+                    profile_id=self.tailored_resume.profile_id,
+                    company_name=self.tailored_resume.company_name or "Unknown Company",
+                    job_title=self.tailored_resume.job_title or "Unknown Position",
+                    raw_text=self.tailored_resume.raw_job_text or "",
+                    location=self.tailored_resume.location or None,
+                    salary_range=self.tailored_resume.salary_range or None,
+                    application_url=self.tailored_resume.application_url or None,
+                    notes=self.tailored_resume.notes or None,
+                    requirements_json="{}",
+                    source=self.tailored_resume.source or "paste",
+                )
+                session.add(job_posting)
+                session.commit()
+                session.refresh(job_posting)
+                job_posting_id = job_posting.id
+
+                logger.info(f"Created new JobPosting: id={job_posting.id}, company={job_posting.company_name}, title={job_posting.job_title}, location={job_posting.location}")
+
+            # Create TailoredResumeModel from the dataclass
+            selected_ids = [acc.bullet_id for acc in self.tailored_resume.selected_accomplishments]
+
+            # Serialize full accomplishment data for later PDF generation
+            accomplishments_data = [
+                {
+                    'bullet_id': acc.bullet_id,
+                    'job_id': acc.job_id,
+                    'text': acc.text,
+                    'skill_match_score': acc.skill_match_score,
+                    'semantic_score': acc.semantic_score,
+                    'recency_score': acc.recency_score,
+                    'metrics_score': acc.metrics_score,
+                    'total_score': acc.total_score,
+                    'matched_skills': acc.matched_skills,
+                    'relevance_explanation': acc.relevance_explanation
+                }
+                for acc in self.tailored_resume.selected_accomplishments
+            ]
+
+            resume_model = TailoredResumeModel(
+                profile_id=self.tailored_resume.profile_id,
+                job_posting_id=job_posting_id,
+                selected_accomplishment_ids=_dumps(selected_ids),
+                selected_accomplishments_json=_dumps(accomplishments_data),
+                skill_coverage_json=_dumps(self.tailored_resume.skill_coverage),
+                coverage_percentage=self.tailored_resume.coverage_percentage,
+                gaps_json=_dumps(self.tailored_resume.gaps),
+                recommendations_json=_dumps(self.tailored_resume.recommendations),
+                match_score=getattr(self.tailored_resume, 'match_score', None),
+            )
+
+            session.add(resume_model)
+            session.commit()
+            session.refresh(resume_model)
+
+            logger.info(f"Created TailoredResumeModel: id={resume_model.id}, job_posting_id={job_posting_id}, accomplishments={len(selected_ids)}")
+
+            self.finished.emit(self.tailored_resume, job_posting_id, resume_model.id)
+        except Exception as e:
+            session.rollback()
+            logger.exception("Failed to save tailored resume")
+            self.error.emit(str(e))
+        finally:
+            session.close()
+
+
 class MainWindow(QMainWindow):
     """Top-level window with navigation menu and screen-based interface."""
 
+    # Emitted after the profile is edited or replaced by an import
+    profile_changed = pyqtSignal()
+
+    dashboard_screen = _LazyScreen()
+    profile_screen = _LazyScreen()
+    companies_screen = _LazyScreen()
+    general_screen = _LazyScreen()
+    education_screen = _LazyScreen()
+    skills_screen = _LazyScreen()
+    upload_screen = _LazyScreen()
+    manage_postings_screen = _LazyScreen()
+    applications_screen = _LazyScreen()
+    results_screen = _LazyScreen()
+    review_screen = _LazyScreen()
+
     def __init__(
         self,
         profile_service: ProfileService,
@@ -90,11 +276,25 @@ class MainWindow(QMainWindow):
         # Single-profile architecture: always use DEFAULT_PROFILE_ID
         self.current_profile_id: int = DEFAULT_PROFILE_ID
         self.current_tailored_resume_id: Optional[int] = None
+        # (first_name, last_name) for the window title; None until loaded
+        self._current_profile_name: Optional[tuple[Optional[str], Optional[str]]] = None
+        # Jobs view of the companies screen; set when that screen is built
+        self.jobs_view = None
+        # One-shot flag: reload the target screen even if it is already shown
+        self._force_refresh = False
+        # Running background workers; finished ones are dropped by _start_worker
+        self._workers: set[QThread] = set()
+        # Whether resume imports use AI; re-read when the settings dialog closes
+        self._ai_enabled: bool = Settings.instance().ai_enabled
 
         # Set window size and make resizable
         self.setGeometry(100, 100, 1200, 800)  # x, y, width, height
         self.setMinimumSize(1000, 600)  # Minimum size to prevent too-small window
 
+        # Status bar only; created first since _ensure_profile may report a save
+        self.status_bar = QStatusBar(self)
+        self.setStatusBar(self.status_bar)
+
         # Ensure profile exists, create if needed
         self._ensure_profile()
 
@@ -119,120 +319,175 @@ class MainWindow(QMainWindow):
         # Right side - stacked screens
         self.stacked_widget = QStackedWidget()
 
-        # Create all screens
-        self.dashboard_screen = DashboardScreen(
+        # Screens are built on first visit; see _get_screen(). Callers get a
+        # read-only view that tracks the cache as screens are added.
+        self._screens: Dict[str, BaseScreen] = {}
+        self.screens: Mapping[str, BaseScreen] = MappingProxyType(self._screens)
+        # Stack index of each built screen, as returned by addWidget()
+        self._screen_index: Dict[str, int] = {}
+        self._screen_factories: Dict[str, Callable[[], BaseScreen]] = {
+            "dashboard": self._create_dashboard_screen,
+            "profile": self._create_profile_screen,
+            "companies": self._create_companies_screen,
+            "general": self._create_general_screen,
+            "education": self._create_education_screen,
+            "skills": self._create_skills_screen,
+            "upload": self._create_upload_screen,
+            "manage_postings": ManageJobPostingsScreen,
+            "applications": self._create_applications_screen,
+            "results": self._create_results_screen,
+            "review": ReviewPrintScreen,
+        }
+
+        layout.addWidget(self.stacked_widget)
+
+        central.setLayout(layout)
+        self.setCentralWidget(central)
+
+        self._refresh_timer = self._create_debounce_timer(self._reload_current_screen)
+        self._companies_refresh_timer = self._create_debounce_timer(self._reload_companies)
+
+        # Refresh the title and visible screen whenever the profile changes
+        self.profile_changed.connect(self._update_window_title)
+        self.profile_changed.connect(self._refresh_current_screen)
+
+        # Hide menu bar completely - navigation only
+        self.menuBar().hide()
+
+        # Set initial screen
+        self._navigate_to("dashboard")
+
+    def _get_screen(self, screen_id: str) -> BaseScreen:
+        """Return the screen for ``screen_id``, building it on first use."""
+        screen = self._screens.get(screen_id)
+        if screen is None:
+            self.stacked_widget.setUpdatesEnabled(False)
+            try:
+                screen = self._screen_factories[screen_id]()
+                self._wire_nav(screen, _NAV_SIGNALS.get(screen_id, ()))
+                self._screens[screen_id] = screen
+                self._screen_index[screen_id] = self.stacked_widget.addWidget(screen)
+            finally:
+                self.stacked_widget.setUpdatesEnabled(True)
+        return screen
+
+    def _wire_nav(self, screen: BaseScreen, entries) -> None:
+        """Connect each (signal name, target screen id) pair to _navigate_to."""
+        for signal_name, target in entries:
+            getattr(screen, signal_name).connect(partial(self._navigate_to, target))
+
+    def _refresh_screens(self, *screen_ids: str) -> None:
+        """Reload the given screens, skipping any that have not been built yet."""
+        self.stacked_widget.setUpdatesEnabled(False)
+        try:
+            for screen_id in screen_ids:
+                screen = self._screens.get(screen_id)
+                if screen is not None:
+                    screen.on_screen_shown()
+        finally:
+            self.stacked_widget.setUpdatesEnabled(True)
+
+    def _expire_shared_session(self) -> None:
+        """Drop cached ORM state after a background worker committed on its own session."""
+        DatabaseManager.get_session().expire_all()
+
+    def _create_dashboard_screen(self) -> DashboardScreen:
+        """Build the dashboard screen."""
+        screen = DashboardScreen(
             profile_service=self.profile_service,
             job_service=self.job_service,
             skill_service=self.skill_service,
             education_service=self.education_service,
         )
-        self.dashboard_screen.navigate_to_upload.connect(lambda: self._navigate_to("upload"))
-        self.dashboard_screen.navigate_to_companies.connect(lambda: self._navigate_to("companies"))
-        self.dashboard_screen.navigate_to_general.connect(lambda: self._navigate_to("general"))
-        self.dashboard_screen.navigate_to_profile_creation.connect(self._edit_profile)  # Changed to edit existing profile
-        self.dashboard_screen.import_resume_requested.connect(self._import_resume)
+        screen.navigate_to_profile_creation.connect(self._edit_profile)  # Changed to edit existing profile
+        screen.import_resume_requested.connect(self._import_resume)
+        return screen
 
-        self.profile_screen = ProfileManagementScreen(
+    def _create_profile_screen(self) -> ProfileManagementScreen:
+        """Build the profile management screen."""
+        screen = ProfileManagementScreen(
             profile_service=self.profile_service,
             skill_service=self.skill_service,
             education_service=self.education_service,
         )
         # Profile actions
-        self.profile_screen.edit_profile_requested.connect(self._edit_profile)
-        self.profile_screen.import_resume_requested.connect(self._import_resume)
+        screen.edit_profile_requested.connect(self._edit_profile)
+        screen.import_resume_requested.connect(self._import_resume)
         # Skills actions
-        self.profile_screen.add_skill_requested.connect(self._add_skill)
-        self.profile_screen.edit_skill_requested.connect(self._edit_skill)
-        self.profile_screen.delete_skill_requested.connect(self._delete_skill)
+        screen.add_skill_requested.connect(self._add_skill)
+        screen.edit_skill_requested.connect(self._edit_skill)
+        screen.delete_skill_requested.connect(self._delete_skill)
         # Education actions
-        self.profile_screen.add_education_requested.connect(self._add_education)
-        self.profile_screen.edit_education_requested.connect(self._edit_education)
-        self.profile_screen.delete_education_requested.connect(self._delete_education)
-
-        self.companies_screen = CompaniesRolesScreen(
+        screen.add_education_requested.connect(self._add_education)
+        screen.edit_education_requested.connect(self._edit_education)
+        screen.delete_education_requested.connect(self._delete_education)
+        return screen
+
+    def _create_companies_screen(self) -> CompaniesRolesScreen:
+        """Build the companies and roles screen."""
+        screen = CompaniesRolesScreen(
             job_service=self.job_service,
         )
-
-        self.general_screen = GeneralInfoScreen(
+        # Job/bullet management
+        self.jobs_view = screen.get_jobs_view()
+        self.jobs_view.job_selected.connect(self._on_job_selected)
+        self.jobs_view.bullet_enhance_requested.connect(self._on_enhance_bullet)
+        screen.add_job_requested.connect(self._add_job)
+        screen.edit_job_requested.connect(self._edit_job)
+        screen.delete_job_requested.connect(self._delete_job)
+        screen.view_recently_deleted_requested.connect(self._view_recently_deleted)
+        # Company management
+        screen.edit_company_requested.connect(self._edit_company)
+        screen.delete_company_requested.connect(self._delete_company)
+        return screen
+
+    def _create_general_screen(self) -> GeneralInfoScreen:
+        """Build the general info screen."""
+        return GeneralInfoScreen(
             skill_service=self.skill_service,
             education_service=self.education_service,
         )
 
-        self.education_screen = EducationScreen(
+    def _create_education_screen(self) -> EducationScreen:
+        """Build the education screen."""
+        screen = EducationScreen(
             education_service=self.education_service,
         )
-        self.education_screen.add_education_requested.connect(self._add_education)
-        self.education_screen.edit_education_requested.connect(self._edit_education)
-        self.education_screen.delete_education_requested.connect(self._delete_education)
-
-        self.skills_screen = SkillsScreen(
+        screen.add_education_requested.connect(self._add_education)
+        screen.edit_education_requested.connect(self._edit_education)
+        screen.delete_education_requested.connect(self._delete_education)
+        return screen
+
+    def _create_skills_screen(self) -> SkillsScreen:
+        """Build the skills screen."""
+        screen = SkillsScreen(
             skill_service=self.skill_service,
         )
-        self.skills_screen.add_skill_requested.connect(self._add_skill)
-        self.skills_screen.edit_skill_requested.connect(self._edit_skill)
-        self.skills_screen.delete_skill_requested.connect(self._delete_skill)
-
-        self.upload_screen = JobPostingScreen(
+        screen.add_skill_requested.connect(self._add_skill)
+        screen.edit_skill_requested.connect(self._edit_skill)
+        screen.delete_skill_requested.connect(self._delete_skill)
+        return screen
+
+    def _create_upload_screen(self) -> JobPostingScreen:
+        """Build the job posting upload screen."""
+        screen = JobPostingScreen(
             profile_service=self.profile_service,
             job_service=self.job_service,
         )
-        self.upload_screen.tailored_resume_ready.connect(self._on_tailored_resume_ready)
-
-        self.results_screen = TailoringResultsScreen()
-        self.results_screen.generate_pdf_requested.connect(self._generate_pdf_resume)
-        self.results_screen.start_over_requested.connect(lambda: self._navigate_to("upload"))
-
-        self.review_screen = ReviewPrintScreen()
-
-        self.applications_screen = ApplicationsScreen()
-        self.applications_screen.application_selected.connect(self._on_application_selected)
-
-        self.manage_postings_screen = ManageJobPostingsScreen()
-
-        # Add screens to stacked widget
-        self.screens = {
-            "dashboard": self.dashboard_screen,
-            "profile": self.profile_screen,
-            "companies": self.companies_screen,
-            "general": self.general_screen,
-            "education": self.education_screen,
-            "skills": self.skills_screen,
-            "upload": self.upload_screen,
-            "manage_postings": self.manage_postings_screen,
-            "applications": self.applications_screen,
-            "results": self.results_screen,
-            "review": self.review_screen,
-        }
-
-        for screen in self.screens.values():
-            self.stacked_widget.addWidget(screen)
-
-        layout.addWidget(self.stacked_widget)
-
-        central.setLayout(layout)
-        self.setCentralWidget(central)
-
-        # Connect signals from companies screen (for job/bullet management)
-        jobs_view = self.companies_screen.get_jobs_view()
-        jobs_view.job_selected.connect(self._on_job_selected)
-        jobs_view.bullet_enhance_requested.connect(self._on_enhance_bullet)
-        self.companies_screen.add_job_requested.connect(self._add_job)
-        self.companies_screen.edit_job_requested.connect(self._edit_job)
-        self.companies_screen.delete_job_requested.connect(self._delete_job)
-        self.companies_screen.view_recently_deleted_requested.connect(self._view_recently_deleted)
-
-        # Connect signals for company management
-        self.companies_screen.edit_company_requested.connect(self._edit_company)
-        self.companies_screen.delete_company_requested.connect(self._delete_company)
+        screen.tailored_resume_ready.connect(self._on_tailored_resume_ready)
+        return screen
 
-        # Hide menu bar completely - navigation only
-        self.menuBar().hide()
-
-        # Status bar only
-        self.setStatusBar(QStatusBar(self))
+    def _create_results_screen(self) -> TailoringResultsScreen:
+        """Build the tailoring results screen."""
+        screen = TailoringResultsScreen()
+        screen.generate_pdf_requested.connect(self._generate_pdf_resume)
+        return screen
 
-        # Set initial screen
-        self._navigate_to("dashboard")
+    def _create_applications_screen(self) -> ApplicationsScreen:
+        """Build the applications screen."""
+        screen = ApplicationsScreen()
+        screen.application_selected.connect(self._on_application_selected)
+        return screen
 
 
     # ------------------------------------------------------------------
@@ -249,16 +504,22 @@ class MainWindow(QMainWindow):
             self._open_settings()
             return
 
-        if screen_id in self.screens:
-            screen = self.screens[screen_id]
-            self.stacked_widget.setCurrentWidget(screen)
+        if screen_id in self._screen_factories:
+            previous = self.stacked_widget.currentWidget()
+            screen = self._get_screen(screen_id)
+            self.stacked_widget.setCurrentIndex(self._screen_index[screen_id])
             if update_nav:
                 # Only update nav menu if not already coming from nav menu click
-                # Temporarily disconnect to avoid recursion
-                self.nav_menu.screen_changed.disconnect(self._on_screen_changed)
-                self.nav_menu.set_current_screen(screen_id)
-                self.nav_menu.screen_changed.connect(self._on_screen_changed)
-            screen.on_screen_shown()
+                # Block its signals so screen_changed does not recurse back here
+                with QSignalBlocker(self.nav_menu):
+                    self.nav_menu.set_current_screen(screen_id)
+            # Re-selecting the visible screen keeps its data unless a change
+            # requested a reload via _force_refresh
+            if screen is not previous or self._force_refresh:
+                self._force_refresh = False
+                # This load satisfies any debounced refresh still pending
+                self._refresh_timer.stop()
+                screen.on_screen_shown()
 
     def _on_screen_changed(self, screen_id: str) -> None:
         """Handle screen change from navigation menu."""
@@ -267,100 +528,76 @@ class MainWindow(QMainWindow):
     def _on_tailored_resume_ready(self, tailored_resume) -> None:
         """Handle when tailored resume is ready from job posting analysis."""
         # The tailored_resume from ProcessingWorker is a TailoredResume dataclass
-        # We need to persist it to the database to get an ID for PDF generation, etc.
-        import json
-        from adaptive_resume.models.tailored_resume import TailoredResumeModel
-        from adaptive_resume.models.job_posting import JobPosting
-        from adaptive_resume.gui.database_manager import DatabaseManager
-
-        session = DatabaseManager.get_session()
-
-        # First, save the JobPosting if it doesn't exist
-        job_posting_id = tailored_resume.job_posting_id
-        if job_posting_id is None:
-            # Create and save a new job posting with all metadata
-            job_posting = JobPosting(
-                profile_id=tailored_resume.profile_id,
-                company_name=tailored_resume.company_name or "Unknown Company",
-                job_title=tailored_resume.job_title or "Unknown Position",
-                raw_text=tailored_resume.raw_job_text or "",
-                location=tailored_resume.location or None,
-                salary_range=tailored_resume.salary_range or None,
-                application_url=tailored_resume.application_url or None,
-                notes=tailored_resume.notes or None,
-                requirements_json="{}",
-                source=tailored_resume.source or "paste",
-            )
-            session.add(job_posting)
-            session.commit()
-            session.refresh(job_posting)
-            job_posting_id = job_posting.id
-
-            logger.info(f"Created new JobPosting: id={job_posting.id}, company={job_posting.company_name}, title={job_posting.job_title}, location={job_posting.location}")
-
-        # Create TailoredResumeModel from the dataclass
-        selected_ids = [acc.bullet_id for acc in tailored_resume.selected_accomplishments]
-
-        # Serialize full accomplishment data for later PDF generation
-        accomplishments_data = []
-        for acc in tailored_resume.selected_accomplishments:
-            accomplishments_data.append({
-                'bullet_id': acc.bullet_id,
-                'job_id': acc.job_id,
-                'text': acc.text,
-                'skill_match_score': acc.skill_match_score,
-                'semantic_score': acc.semantic_score,
-                'recency_score': acc.recency_score,
-                'metrics_score': acc.metrics_score,
-                'total_score': acc.total_score,
-                'matched_skills': acc.matched_skills,
-                'relevance_explanation': acc.relevance_explanation
-            })
-
-        resume_model = TailoredResumeModel(
-            profile_id=tailored_resume.profile_id,
-            job_posting_id=job_posting_id,
-            selected_accomplishment_ids=json.dumps(selected_ids),
-            selected_accomplishments_json=json.dumps(accomplishments_data),
-            skill_coverage_json=json.dumps(tailored_resume.skill_coverage),
-            coverage_percentage=tailored_resume.coverage_percentage,
-            gaps_json=json.dumps(tailored_resume.gaps),
-            recommendations_json=json.dumps(tailored_resume.recommendations),
-            match_score=getattr(tailored_resume, 'match_score', None),
+        # It is saved in the background to get an ID for PDF generation, etc.
+        worker = TailoredResumePersistWorker(
+            DatabaseManager.get_session().get_bind(), tailored_resume
         )
+        worker.finished.connect(self._apply_persisted_resume)
+        worker.error.connect(self._on_resume_persist_failed)
+        self._start_worker(worker)
 
-        session.add(resume_model)
-        session.commit()
-        session.refresh(resume_model)
-
-        logger.info(f"Created TailoredResumeModel: id={resume_model.id}, job_posting_id={job_posting_id}, accomplishments={len(selected_ids)}")
+    def _apply_persisted_resume(self, tailored_resume, job_posting_id: int, resume_id: int) -> None:
+        """Show a tailored resume once it has been saved."""
+        # The worker committed through its own session; drop our stale copies
+        self._expire_shared_session()
 
         # Update the dataclass with database IDs for use in results screen
         tailored_resume.job_posting_id = job_posting_id
-        tailored_resume.id = resume_model.id
+        tailored_resume.id = resume_id
 
-        self.current_tailored_resume_id = resume_model.id
+        self.current_tailored_resume_id = resume_id
         self.results_screen.display_results(tailored_resume)
         self._navigate_to("results")
 
+    def _on_resume_persist_failed(self, message: str) -> None:
+        """Report a tailored resume that could not be saved."""
+        QMessageBox.critical(self, "Error", f"Failed to save tailored resume: {message}")
+
+    def _start_worker(self, worker: QThread) -> None:
+        """Start a background worker, keeping it referenced until it finishes."""
+        self._workers.difference_update([w for w in self._workers if w.isFinished()])
+        self._workers.add(worker)
+        worker.start()
+
+    def _create_debounce_timer(self, slot: Callable[[], None]) -> QTimer:
+        """Create a single-shot timer that runs ``slot`` once a burst of starts settles."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(_REFRESH_DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
+
     def _refresh_current_screen(self) -> None:
-        """Refresh the current screen."""
+        """Schedule a refresh of the current screen."""
+        self._refresh_timer.start()
+
+    def _reload_current_screen(self) -> None:
+        """Reload the current screen now."""
+        # The stack only holds BaseScreen instances built by _get_screen()
         current_screen = self.stacked_widget.currentWidget()
-        if hasattr(current_screen, 'on_screen_shown'):
+        if current_screen is not None:
             current_screen.on_screen_shown()
 
+    def _refresh_companies(self) -> None:
+        """Schedule a reload of the companies screen."""
+        self._companies_refresh_timer.start()
+
+    def _reload_companies(self) -> None:
+        """Reload the companies screen now."""
+        self.companies_screen.on_screen_shown()
+
     # ------------------------------------------------------------------
     # Profile management (single-profile mode)
     # ------------------------------------------------------------------
     def _ensure_profile(self) -> None:
         """Ensure a default profile exists, creating one if needed."""
-        profile = self.profile_service.get_default_profile()
+        self._current_profile_name = self.profile_service.get_default_profile_name()
 
-        if profile is None:
+        if self._current_profile_name is None:
             # No profile exists - check if this is first run
             # The welcome wizard will handle profile creation
             # For now, create a minimal placeholder
-            profile = self.profile_service.ensure_profile_exists()
+            self.profile_service.ensure_profile_exists()
 
             # Show welcome dialog to complete profile setup
             QMessageBox.information(
@@ -376,10 +613,12 @@ class MainWindow(QMainWindow):
     def _update_window_title(self) -> None:
         """Update window title with current profile name."""
         try:
-            profile = self.profile_service.get_default_profile()
-            if profile and profile.first_name and profile.last_name:
+            if self._current_profile_name is None:
+                self._current_profile_name = self.profile_service.get_default_profile_name()
+            first_name, last_name = self._current_profile_name or (None, None)
+            if first_name and last_name:
                 self.setWindowTitle(
-                    f"Adaptive Resume Generator - {profile.first_name} {profile.last_name}"
+                    f"Adaptive Resume Generator - {first_name} {last_name}"
                 )
             else:
                 self.setWindowTitle("Adaptive Resume Generator")
@@ -397,22 +636,22 @@ class MainWindow(QMainWindow):
         if not profile:
             QMessageBox.warning(self, "Error", "Unable to load profile.")
             return
-        dialog = ProfileDialog(
-            self,
-            profile={
-                "first_name": profile.first_name,
-                "last_name": profile.last_name,
-                "email": profile.email,
-                "phone": profile.phone or "",
-                "city": profile.city or "",
-                "state": profile.state or "",
-                "linkedin_url": profile.linkedin_url or "",
-                "portfolio_url": profile.portfolio_url or "",
-                "professional_summary": profile.professional_summary or "",
-            },
-        )
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        current = {
+            "first_name": profile.first_name,
+            "last_name": profile.last_name,
+            "email": profile.email,
+            "phone": profile.phone or "",
+            "city": profile.city or "",
+            "state": profile.state or "",
+            "linkedin_url": profile.linkedin_url or "",
+            "portfolio_url": profile.portfolio_url or "",
+            "professional_summary": profile.professional_summary or "",
+        }
+        dialog = ProfileDialog(self, profile=current)
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
+            if asdict(data) == current:
+                return  # Nothing changed; skip the save and screen refresh
             try:
                 self.profile_service.update_profile(
                     profile_id=DEFAULT_PROFILE_ID,
@@ -430,18 +669,15 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", str(exc))
                 return
 
-            self._update_window_title()
-            self._refresh_current_screen()
-            self.statusBar().showMessage("Profile updated successfully", 3000)
+            self._current_profile_name = (data.first_name, data.last_name)
+            self.profile_changed.emit()
+            self.status_bar.showMessage("Profile updated successfully", 3000)
 
     def _import_resume(self) -> None:
         """Import resume to create or update a profile."""
-        # Check if AI is enabled in settings
-        use_ai = self.settings.ai_enabled if hasattr(self.settings, 'ai_enabled') else False
-
         # Step 1: Open the import dialog to select and extract resume
-        import_dialog = ResumeImportDialog(parent=self, use_ai=use_ai)
-        if import_dialog.exec() != int(QDialog.DialogCode.Accepted):
+        import_dialog = ResumeImportDialog(parent=self, use_ai=self._ai_enabled)
+        if import_dialog.exec() != _ACCEPTED:
             return  # User cancelled
 
         # Step 2: Get the extracted resume data
@@ -456,18 +692,21 @@ class MainWindow(QMainWindow):
             profile_id=1,  # Default profile ID for desktop app
             parent=self
         )
-        if preview_dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if preview_dialog.exec() == _ACCEPTED:
+            # The import committed on the worker's own session
+            self._expire_shared_session()
             # After successful import, refresh all screens
-            self._update_window_title()
-            self._refresh_current_screen()
-            self.statusBar().showMessage("Resume imported successfully!", 3000)
-            # Navigate to profile screen to show the results
+            self._current_profile_name = None  # The import may have renamed the profile
+            self.profile_changed.emit()
+            self.status_bar.showMessage("Resume imported successfully!", 3000)
+            # Navigate to profile screen to show the results; loading it there
+            # cancels the debounced refresh, so it loads once either way
             self._navigate_to("profile")
 
     def _add_job(self) -> None:
         """Add a new job."""
         dialog = JobDialog(self)
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
             try:
                 job = self.job_service.create_job(
@@ -485,22 +724,21 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", str(exc))
                 return
 
-            # Navigate to companies screen and refresh
+            # Navigate to companies screen; _force_refresh makes _navigate_to
+            # reload it exactly once, even if it is already showing
+            self._force_refresh = True
             self._navigate_to("companies")
-            self.companies_screen.on_screen_shown()
-            self.statusBar().showMessage("Job created successfully", 3000)
+            self.status_bar.showMessage("Job created successfully", 3000)
 
     def _edit_job(self) -> None:
         """Edit the selected job."""
         # Get current job from companies screen
-        jobs_view = self.companies_screen.get_jobs_view()
-        job_id = jobs_view.current_job_id()
+        job_id = self.jobs_view.current_job_id()
         if job_id is None:
             QMessageBox.information(self, "No Job Selected", "Please select a job to edit.")
             return
 
         job = self.job_service.get_job_by_id(job_id)
-        bullets = self.job_service.get_bullet_points_for_job(job_id)
         dialog = JobDialog(
             self,
             job={
@@ -510,10 +748,10 @@ class MainWindow(QMainWindow):
                 "start_date": job.start_date,
                 "end_date": job.end_date,
                 "description": job.description or "",
-                "bullets": [bullet.content for bullet in bullets],
+                "bullets": self.job_service.get_bullet_contents_for_job(job_id),
             },
         )
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
             try:
                 self.job_service.update_job(
@@ -533,13 +771,12 @@ class MainWindow(QMainWindow):
 
             self.companies_screen.on_screen_shown()
             self._on_job_selected(job_id)
-            self.statusBar().showMessage("Job updated successfully", 3000)
+            self.status_bar.showMessage("Job updated successfully", 3000)
 
     def _delete_job(self) -> None:
         """Delete the selected job/role."""
         # Get current job from companies screen
-        jobs_view = self.companies_screen.get_jobs_view()
-        job_id = jobs_view.current_job_id()
+        job_id = self.jobs_view.current_job_id()
         if job_id is None:
             QMessageBox.information(self, "No Role Selected", "Please select a role to delete.")
             return
@@ -558,11 +795,11 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.No
         )
 
-        if confirm == QMessageBox.StandardButton.Yes:
+        if confirm == _YES:
             try:
                 self.job_service.delete_job(job_id)
-                self.companies_screen.on_screen_shown()
-                self.statusBar().showMessage("Role deleted successfully", 3000)
+                self._refresh_companies()
+                self.status_bar.showMessage("Role deleted successfully", 3000)
             except Exception as exc:  # pragma: no cover
                 QMessageBox.critical(self, "Error", f"Failed to delete role: {str(exc)}")
 
@@ -572,22 +809,19 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
         # Refresh the companies screen in case items were restored
-        self.companies_screen.on_screen_shown()
+        self._refresh_companies()
 
     def _edit_company(self) -> None:
         """Edit a company's information."""
         # Get selected company from companies screen
-        if not hasattr(self.companies_screen, 'selected_company') or not self.companies_screen.selected_company:
+        if not self.companies_screen.selected_company:
             QMessageBox.information(self, "No Company Selected", "Please select a company to edit.")
             return
 
         company_name = self.companies_screen.selected_company
 
         # Get the first job for this company to get location info
-        jobs_for_company = [
-            job for job in self.companies_screen.all_jobs
-            if job.company_name == company_name
-        ]
+        jobs_for_company = self.companies_screen.get_jobs_for_company(company_name)
 
         if not jobs_for_company:
             QMessageBox.warning(self, "Error", "No jobs found for this company.")
@@ -601,37 +835,29 @@ class MainWindow(QMainWindow):
             company_location=current_location,
         )
 
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
 
             # Update all jobs for this company with new name and location
             try:
-                for job in jobs_for_company:
-                    self.job_service.update_job(
-                        job_id=job.id,
-                        company_name=data.name,
-                        location=data.location or None,
-                    )
-
-                self.companies_screen.on_screen_shown()
-                self.statusBar().showMessage(f"Company '{data.name}' updated successfully", 3000)
+                self.job_service.rename_company(company_name, data.name, data.location or None)
+
+                self._refresh_companies()
+                self.status_bar.showMessage(f"Company '{data.name}' updated successfully", 3000)
             except Exception as exc:
                 QMessageBox.critical(self, "Error", f"Failed to update company: {str(exc)}")
 
     def _delete_company(self) -> None:
         """Delete a company and all its associated jobs."""
         # Get selected company from companies screen
-        if not hasattr(self.companies_screen, 'selected_company') or not self.companies_screen.selected_company:
+        if not self.companies_screen.selected_company:
             QMessageBox.information(self, "No Company Selected", "Please select a company to delete.")
             return
 
         company_name = self.companies_screen.selected_company
 
         # Get all jobs for this company
-        jobs_for_company = [
-            job for job in self.companies_screen.all_jobs
-            if job.company_name == company_name
-        ]
+        jobs_for_company = self.companies_screen.get_jobs_for_company(company_name)
 
         if not jobs_for_company:
             QMessageBox.warning(self, "Error", "No jobs found for this company.")
@@ -647,26 +873,20 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.No,
         )
 
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply == _YES:
             try:
-                for job in jobs_for_company:
-                    # Delete all bullets for this job first
-                    bullets = self.job_service.get_bullet_points_for_job(job.id)
-                    for bullet in bullets:
-                        self.job_service.delete_bullet_point(bullet.id)
+                # Delete every role and its bullets in one transaction
+                self.job_service.delete_jobs_bulk([job.id for job in jobs_for_company])
 
-                    # Delete the job
-                    self.job_service.delete_job(job.id)
-
-                self.companies_screen.on_screen_shown()
-                self.statusBar().showMessage(f"Company '{company_name}' and all roles deleted", 3000)
+                self._refresh_companies()
+                self.status_bar.showMessage(f"Company '{company_name}' and all roles deleted", 3000)
             except Exception as exc:
                 QMessageBox.critical(self, "Error", f"Failed to delete company: {str(exc)}")
 
     def _add_education(self) -> None:
         """Add a new education entry."""
         dialog = EducationDialog(self)
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
             try:
                 self.education_service.create_education(
@@ -681,9 +901,8 @@ class MainWindow(QMainWindow):
                     display_order=0,
                 )
                 # Refresh both education screen and profile screen
-                self.education_screen.on_screen_shown()
-                self.profile_screen.on_screen_shown()
-                self.statusBar().showMessage("Education added successfully", 3000)
+                self._refresh_screens("education", "profile")
+                self.status_bar.showMessage("Education added successfully", 3000)
             except Exception as exc:  # pragma: no cover
                 QMessageBox.critical(self, "Error", str(exc))
 
@@ -710,7 +929,7 @@ class MainWindow(QMainWindow):
                 "relevant_coursework": education.relevant_coursework or "",
             },
         )
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
             try:
                 self.education_service.update_education(
@@ -725,9 +944,8 @@ class MainWindow(QMainWindow):
                     relevant_coursework=data.relevant_coursework,
                 )
                 # Refresh both education screen and profile screen
-                self.education_screen.on_screen_shown()
-                self.profile_screen.on_screen_shown()
-                self.statusBar().showMessage("Education updated successfully", 3000)
+                self._refresh_screens("education", "profile")
+                self.status_bar.showMessage("Education updated successfully", 3000)
             except Exception as exc:  # pragma: no cover
                 QMessageBox.critical(self, "Error", str(exc))
 
@@ -751,20 +969,19 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.No
         )
 
-        if confirm == QMessageBox.StandardButton.Yes:
+        if confirm == _YES:
             try:
                 self.education_service.delete_education(education_id)
                 # Refresh both education screen and profile screen
-                self.education_screen.on_screen_shown()
-                self.profile_screen.on_screen_shown()
-                self.statusBar().showMessage("Education deleted successfully", 3000)
+                self._refresh_screens("education", "profile")
+                self.status_bar.showMessage("Education deleted successfully", 3000)
             except Exception as exc:  # pragma: no cover
                 QMessageBox.critical(self, "Error", f"Failed to delete education: {str(exc)}")
 
     def _add_skill(self) -> None:
         """Add a new skill."""
         dialog = SkillDialog(self)
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
             try:
                 self.skill_service.create_skill(
@@ -775,9 +992,8 @@ class MainWindow(QMainWindow):
                     display_order=0,
                 )
                 # Refresh both skills screen and profile screen
-                self.skills_screen.on_screen_shown()
-                self.profile_screen.on_screen_shown()
-                self.statusBar().showMessage("Skill added successfully", 3000)
+                self._refresh_screens("skills", "profile")
+                self.status_bar.showMessage("Skill added successfully", 3000)
             except Exception as exc:  # pragma: no cover
                 QMessageBox.critical(self, "Error", str(exc))
 
@@ -800,7 +1016,7 @@ class MainWindow(QMainWindow):
                 "years_experience": skill.years_experience,
             },
         )
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             data = dialog.get_result()
             try:
                 self.skill_service.update_skill(
@@ -811,9 +1027,8 @@ class MainWindow(QMainWindow):
                     years_experience=data.years_experience,
                 )
                 # Refresh both skills screen and profile screen
-                self.skills_screen.on_screen_shown()
-                self.profile_screen.on_screen_shown()
-                self.statusBar().showMessage("Skill updated successfully", 3000)
+                self._refresh_screens("skills", "profile")
+                self.status_bar.showMessage("Skill updated successfully", 3000)
             except Exception as exc:  # pragma: no cover
                 QMessageBox.critical(self, "Error", str(exc))
 
@@ -837,35 +1052,24 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.No
         )
 
-        if confirm == QMessageBox.StandardButton.Yes:
+        if confirm == _YES:
             try:
                 self.skill_service.delete_skill(skill_id)
                 # Refresh both skills screen and profile screen
-                self.skills_screen.on_screen_shown()
-                self.profile_screen.on_screen_shown()
-                self.statusBar().showMessage("Skill deleted successfully", 3000)
+                self._refresh_screens("skills", "profile")
+                self.status_bar.showMessage("Skill deleted successfully", 3000)
             except Exception as exc:  # pragma: no cover
                 QMessageBox.critical(self, "Error", f"Failed to delete skill: {str(exc)}")
 
     def _sync_bullets(self, job_id: int, bullets: list[str]) -> None:
         """Sync bullet points for a job."""
-        existing = self.job_service.get_bullet_points_for_job(job_id)
-        for bullet in existing:
-            self.job_service.delete_bullet_point(bullet.id)
-
-        for order, content in enumerate(bullets, start=1):
-            if len(content.strip()) < 10:
-                continue
-            self.job_service.create_bullet_point(
-                job_id=job_id,
-                content=content.strip(),
-                display_order=order,
-            )
+        self.job_service.replace_bullet_points(job_id, bullets)
 
     def _open_settings(self) -> None:
         """Open the settings dialog."""
         dialog = SettingsDialog(self)
         dialog.exec()
+        self._ai_enabled = Settings.instance().ai_enabled
 
     def _generate_pdf_resume(self) -> None:
         """Open PDF preview dialog for current tailored resume."""
@@ -892,11 +1096,8 @@ class MainWindow(QMainWindow):
 
     def _on_enhance_bullet(self, bullet_id: int) -> None:
         """Open bullet enhancement dialog."""
-        # Get the bullet point
-        bullet = None
-        for bp in self.job_service.session.query(BulletPoint).filter_by(id=bullet_id).all():
-            bullet = bp
-            break
+        # Get the bullet point (identity map first, then a primary-key lookup)
+        bullet = self.job_service.session.get(BulletPoint, bullet_id)
 
         if bullet is None:
             QMessageBox.warning(self, "Error", "Could not find bullet point.")
@@ -904,27 +1105,35 @@ class MainWindow(QMainWindow):
 
         # Open enhancement dialog
         dialog = BulletEnhancementDialog(bullet.content, self)
-        if dialog.exec() == int(QDialog.DialogCode.Accepted):
+        if dialog.exec() == _ACCEPTED:
             enhanced_text = dialog.get_enhanced_text()
             if enhanced_text:
-                # Update the bullet
-                bullet.content = enhanced_text
-                self.job_service.session.commit()
+                # Save off the GUI thread; the display refreshes when it finishes
+                worker = BulletUpdateWorker(
+                    self.job_service.session.get_bind(), bullet_id, enhanced_text
+                )
+                worker.finished.connect(self._on_bullet_enhanced)
+                worker.error.connect(self._on_bullet_save_failed)
+                self._start_worker(worker)
 
-                # Refresh the display
-                job_id = bullet.job_id
-                self._on_job_selected(job_id)
-                self.statusBar().showMessage("Bullet enhanced successfully", 3000)
+    def _on_bullet_enhanced(self, job_id: int) -> None:
+        """Refresh the job details after an enhanced bullet is saved."""
+        # The worker committed through its own session; drop our stale copies
+        self._expire_shared_session()
+        self._on_job_selected(job_id)
+        self.status_bar.showMessage("Bullet enhanced successfully", 3000)
+
+    def _on_bullet_save_failed(self, message: str) -> None:
+        """Report a failed save of an enhanced bullet."""
+        QMessageBox.critical(self, "Error", f"Failed to save bullet: {message}")
 
     def _on_job_selected(self, job_id: int) -> None:
         """Handle job selection."""
         if job_id <= 0:
             return
 
-        jobs_view = self.companies_screen.get_jobs_view()
-        job = self.job_service.get_job_by_id(job_id)
-        bullets = self.job_service.get_bullet_points_for_job(job_id)
-        jobs_view.show_job_details(job, bullets)
+        job, bullets = self.job_service.get_job_with_bullets(job_id)
+        self.jobs_view.show_job_details(job, bullets)
 
     def _on_application_selected(self, application_id: int) -> None:
         """Handle application selection.
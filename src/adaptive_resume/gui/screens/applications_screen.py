@@ -14,6 +14,7 @@ Features:
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional, List, Dict, Any
 from datetime import date, timedelta
 
@@ -570,7 +571,7 @@ class ApplicationsScreen(BaseScreen):
         from adaptive_resume.gui.dialogs import ApplicationDetailDialog
 
         dialog = ApplicationDetailDialog(application_id, parent=self)
-        dialog.application_updated.connect(lambda: self.load_applications())
+        dialog.application_updated.connect(self.load_applications)
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.load_applications()
@@ -582,17 +583,17 @@ class ApplicationsScreen(BaseScreen):
         menu = QMenu(self)
 
         view_action = QAction("View Details", self)
-        view_action.triggered.connect(lambda: self._view_application_detail(application_id))
+        view_action.triggered.connect(partial(self._view_application_detail, application_id))
         menu.addAction(view_action)
 
         edit_action = QAction("Edit", self)
-        edit_action.triggered.connect(lambda: self._edit_application(application_id))
+        edit_action.triggered.connect(partial(self._edit_application, application_id))
         menu.addAction(edit_action)
 
         menu.addSeparator()
 
         delete_action = QAction("Delete", self)
-        delete_action.triggered.connect(lambda: self._delete_application(application_id))
+        delete_action.triggered.connect(partial(self._delete_application, application_id))
         menu.addAction(delete_action)
 
         menu.exec(self.sender().mapToGlobal(self.sender().rect().bottomLeft()))
@@ -602,7 +603,7 @@ class ApplicationsScreen(BaseScreen):
         from adaptive_resume.gui.dialogs import AddApplicationDialog
 
         dialog = AddApplicationDialog(DEFAULT_PROFILE_ID, parent=self)
-        dialog.application_created.connect(lambda app_id: self.load_applications())
+        dialog.application_created.connect(self.load_applications)
 
         dialog.exec()
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 try:
     from PyQt6.QtWidgets import (
@@ -47,6 +47,7 @@ class CompaniesRolesScreen(BaseScreen):
         self.job_service = job_service
         self.selected_company: Optional[str] = None
         self.all_jobs = []
+        self._jobs_by_company: Dict[str, List] = {}
         super().__init__(parent)
 
     def _setup_ui(self) -> None:
@@ -164,20 +165,19 @@ class CompaniesRolesScreen(BaseScreen):
             self.jobs_view.set_jobs([])
             return
 
-        # Filter jobs by selected company
-        filtered_jobs = [
-            job for job in self.all_jobs
-            if job.company_name == self.selected_company
-        ]
-
-        # Sort by start_date descending (newest first)
-        filtered_jobs.sort(key=lambda j: j.start_date if j.start_date else '', reverse=True)
+        # Sort the company's jobs by start_date descending (newest first)
+        filtered_jobs = sorted(
+            self.get_jobs_for_company(self.selected_company),
+            key=lambda j: j.start_date if j.start_date else '',
+            reverse=True,
+        )
 
         self.jobs_view.set_jobs(filtered_jobs)
 
     def _load_companies(self) -> None:
         """Load and display all companies."""
         if not self.job_service:
+            self._jobs_by_company = {}
             self.companies_list.clear()
             self.jobs_view.set_jobs([])
             return
@@ -185,16 +185,16 @@ class CompaniesRolesScreen(BaseScreen):
         # Get all jobs for the profile
         self.all_jobs = self.job_service.get_jobs_for_profile(DEFAULT_PROFILE_ID)
 
-        # Extract unique companies with their locations and role counts
-        companies_dict = {}
+        # Index jobs by company in one pass
+        self._jobs_by_company = {}
         for job in self.all_jobs:
-            company_name = job.company_name
-            if company_name not in companies_dict:
-                companies_dict[company_name] = {
-                    'location': job.location or '',
-                    'count': 0
-                }
-            companies_dict[company_name]['count'] += 1
+            self._jobs_by_company.setdefault(job.company_name, []).append(job)
+
+        # Unique companies with their locations (from the first job) and role counts
+        companies_dict = {
+            company_name: {'location': jobs[0].location or '', 'count': len(jobs)}
+            for company_name, jobs in self._jobs_by_company.items()
+        }
 
         # Sort companies alphabetically
         sorted_companies = sorted(companies_dict.items())
@@ -221,6 +221,10 @@ class CompaniesRolesScreen(BaseScreen):
             self.selected_company = first_company
             self._filter_and_display_roles()
 
+    def get_jobs_for_company(self, company_name: str) -> List:
+        """Get the loaded jobs for a company, in load order."""
+        return self._jobs_by_company.get(company_name, [])
+
     def get_jobs_view(self) -> JobsView:
         """Get the jobs view for connecting signals."""
         return self.jobs_view
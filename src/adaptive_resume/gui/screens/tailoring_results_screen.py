@@ -40,6 +40,7 @@ class TailoringResultsScreen(BaseScreen):
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         self.tailored_resume: Optional[TailoredResume] = None
+        self._variants_dialog: Optional[ResumeVariantsDialog] = None
         super().__init__(parent)
 
     def _setup_ui(self) -> None:
@@ -459,14 +460,20 @@ class TailoringResultsScreen(BaseScreen):
             if hasattr(self.tailored_resume, 'id') and self.tailored_resume.id:
                 current_variant_id = self.tailored_resume.id
 
-            # Open variants dialog
-            dialog = ResumeVariantsDialog(
-                job_posting_id=self.tailored_resume.job_posting_id,
-                current_variant_id=current_variant_id,
-                parent=self
-            )
+            # Open variants dialog, reusing the one built on the first open
+            if self._variants_dialog is None:
+                self._variants_dialog = ResumeVariantsDialog(
+                    job_posting_id=self.tailored_resume.job_posting_id,
+                    current_variant_id=current_variant_id,
+                    parent=self
+                )
+            else:
+                self._variants_dialog.reset(
+                    self.tailored_resume.job_posting_id,
+                    current_variant_id
+                )
 
-            dialog.exec()
+            self._variants_dialog.exec()
 
             # Could optionally reload/refresh results if a different variant was selected
             logger.info("Variants dialog closed")
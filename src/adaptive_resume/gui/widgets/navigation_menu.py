@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional
 
 try:
@@ -64,7 +65,7 @@ class NavigationMenu(QWidget):
             btn.setObjectName("navButton")
             btn.setCheckable(True)
             btn.setMinimumHeight(50)
-            btn.clicked.connect(lambda checked, s=screen_id: self._on_button_clicked(s))
+            btn.clicked.connect(partial(self._on_button_clicked, screen_id))
             self.buttons[screen_id] = btn
             layout.addWidget(btn)
 
@@ -85,7 +86,7 @@ class NavigationMenu(QWidget):
         profile_btn.setObjectName("navButton")
         profile_btn.setCheckable(True)
         profile_btn.setMinimumHeight(50)
-        profile_btn.clicked.connect(lambda checked: self._on_button_clicked("profile"))
+        profile_btn.clicked.connect(partial(self._on_button_clicked, "profile"))
         self.buttons["profile"] = profile_btn
         layout.addWidget(profile_btn)
 
@@ -82,3 +82,19 @@ class TailoredResumeModel(Base):
         if self.match_score is not None:
             return f"{self.match_score * 100:.0f}%"
         return "N/A"
+
+    @property
+    def formatted_created_at(self) -> str:
+        """Get formatted creation timestamp.
+
+        ``created_at`` never changes once the row exists, so the string is
+        cached on the instance after the first successful format.
+        """
+        cached = self.__dict__.get('_formatted_created_at')
+        if cached is not None:
+            return cached
+        if self.created_at is None:
+            return "N/A"
+        cached = self.created_at.strftime("%Y-%m-%d %H:%M")
+        self._formatted_created_at = cached
+        return cached
@@ -66,7 +66,7 @@ Do not include any other text, explanation, or markdown formatting - ONLY the JS
         Args:
             api_key: Optional Anthropic API key. If not provided, will try to load from settings.
         """
-        self.settings = Settings()
+        self.settings = Settings.instance()
         self.api_key = api_key or self.settings.get_api_key()
         self.enabled = bool(self.api_key)
         
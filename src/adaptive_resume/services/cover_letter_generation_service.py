@@ -43,7 +43,7 @@ class CoverLetterGenerationService:
             api_key: Optional Anthropic API key. If not provided, will try to load from settings.
         """
         self.session = session
-        self.settings = Settings()
+        self.settings = Settings.instance()
         self.api_key = api_key or self.settings.get_api_key()
         self.enabled = bool(self.api_key)
 
@@ -7,7 +7,8 @@ bullet points, including validation, business rules, and tag management.
 
 from typing import Optional, List, Tuple
 from datetime import date, datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy.exc import IntegrityError
 from adaptive_resume.models import Job, BulletPoint, Tag, BulletTag, Profile
 from adaptive_resume.models.base import DEFAULT_PROFILE_ID
@@ -141,6 +142,36 @@ class JobService:
             raise JobNotFoundError(f"Job with id {job_id} not found")
 
         return job
+
+    def get_job_with_bullets(self, job_id: int) -> Tuple[Job, List[BulletPoint]]:
+        """
+        Get a job and its active bullet points in a single query.
+
+        The bullets come from an outer join rather than ``Job.bullet_points``,
+        so the relationship collection (which also holds soft-deleted
+        bullets) is left untouched.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            Tuple of the job and its bullet points, ordered by display_order
+
+        Raises:
+            JobNotFoundError: If job not found
+        """
+        rows = self.session.query(Job, BulletPoint).outerjoin(
+            BulletPoint,
+            and_(BulletPoint.job_id == Job.id, BulletPoint.deleted_at.is_(None))
+        ).filter(
+            Job.id == job_id,
+            Job.deleted_at.is_(None)
+        ).order_by(BulletPoint.display_order).all()
+
+        if not rows:
+            raise JobNotFoundError(f"Job with id {job_id} not found")
+
+        return rows[0][0], [bullet for _, bullet in rows if bullet is not None]
     
     def get_jobs_for_profile(self, profile_id: int = DEFAULT_PROFILE_ID, include_deleted: bool = False) -> List[Job]:
         """
@@ -232,6 +263,45 @@ class JobService:
         self.session.commit()
         self.session.refresh(job)
         return job
+
+    def rename_company(
+        self,
+        old_name: str,
+        new_name: str,
+        new_location: Optional[str],
+        profile_id: int = DEFAULT_PROFILE_ID
+    ) -> int:
+        """
+        Rename and relocate every active job at a company in one UPDATE.
+
+        Args:
+            old_name: Current company name
+            new_name: New company name
+            new_location: New location for every job; None or blank keeps
+                each job's current location
+            profile_id: Profile whose jobs are updated
+
+        Returns:
+            int: Number of jobs updated
+
+        Raises:
+            JobValidationError: If the new company name is empty
+        """
+        if not new_name or not new_name.strip():
+            raise JobValidationError("Company name cannot be empty")
+
+        values = {Job.company_name: new_name.strip()}
+        if new_location and new_location.strip():
+            values[Job.location] = new_location.strip()
+
+        updated = self.session.query(Job).filter(
+            Job.profile_id == profile_id,
+            Job.company_name == old_name,
+            Job.deleted_at.is_(None)
+        ).update(values, synchronize_session=False)
+
+        self.session.commit()
+        return updated
     
     def delete_job(self, job_id: int) -> None:
         """
@@ -256,6 +326,31 @@ class JobService:
                 bullet.deleted_at = datetime.now()
 
         self.session.commit()
+
+    def delete_jobs_bulk(self, job_ids: List[int]) -> None:
+        """
+        Soft delete several jobs and their bullet points in one transaction.
+
+        Uses one UPDATE for the bullet points and one for the jobs, so the
+        cost does not grow with the number of bullets.
+
+        Args:
+            job_ids: IDs of the jobs to delete
+        """
+        if not job_ids:
+            return
+
+        now = datetime.now()
+        self.session.query(BulletPoint).filter(
+            BulletPoint.job_id.in_(job_ids),
+            BulletPoint.deleted_at.is_(None)
+        ).update({BulletPoint.deleted_at: now}, synchronize_session=False)
+        self.session.query(Job).filter(
+            Job.id.in_(job_ids),
+            Job.deleted_at.is_(None)
+        ).update({Job.deleted_at: now}, synchronize_session=False)
+
+        self.session.commit()
     
     # ==================== BulletPoint CRUD Operations ====================
     
@@ -364,6 +459,24 @@ class JobService:
             query = query.filter(BulletPoint.deleted_at.is_(None))
 
         return query.order_by(BulletPoint.display_order).all()
+
+    def get_bullet_contents_for_job(self, job_id: int) -> List[str]:
+        """
+        Get the text of a job's live bullet points without loading the objects.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            List[str]: Bullet point contents, ordered by display_order
+        """
+        rows = (
+            self.session.query(BulletPoint.content)
+            .filter(BulletPoint.job_id == job_id, BulletPoint.deleted_at.is_(None))
+            .order_by(BulletPoint.display_order)
+            .all()
+        )
+        return [content for (content,) in rows]
     
     def update_bullet_point(
         self,
@@ -436,6 +549,44 @@ class JobService:
 
         self.session.commit()
 
+    def replace_bullet_points(self, job_id: int, contents: List[str]) -> None:
+        """
+        Replace all of a job's bullet points in one transaction.
+
+        Existing bullet points are soft deleted with a single UPDATE and the
+        new ones are bulk inserted. Entries shorter than 10 characters are
+        skipped; display order follows each entry's position in ``contents``.
+
+        Args:
+            job_id: The job ID
+            contents: Bullet point texts, in display order
+
+        Raises:
+            BulletPointValidationError: If the job does not exist or an
+                entry is longer than 1000 characters
+        """
+        if not self._job_exists(job_id):
+            raise BulletPointValidationError(f"Job with id {job_id} does not exist")
+
+        rows = []
+        for order, content in enumerate(contents, start=1):
+            content = content.strip()
+            if len(content) < 10:
+                continue
+            if len(content) > 1000:
+                raise BulletPointValidationError("Bullet point content must be 1000 characters or less")
+            rows.append({'job_id': job_id, 'content': content, 'display_order': order})
+
+        self.session.query(BulletPoint).filter(
+            BulletPoint.job_id == job_id,
+            BulletPoint.deleted_at.is_(None)
+        ).update({BulletPoint.deleted_at: datetime.now()}, synchronize_session=False)
+
+        if rows:
+            self.session.bulk_insert_mappings(BulletPoint, rows)
+
+        self.session.commit()
+
     # ==================== Soft Delete Management ====================
 
     def get_recently_deleted_jobs(self, profile_id: int = DEFAULT_PROFILE_ID, days: int = 30) -> List[Job]:
@@ -467,6 +618,9 @@ class JobService:
             profile_id: The profile ID (default: DEFAULT_PROFILE_ID)
             days: Number of days to look back (default 30)
 
+        The parent job is populated from the same join, so reading
+        ``bullet.job`` does not issue a query per bullet.
+
         Returns:
             List[BulletPoint]: Recently deleted bullets, ordered by deletion date (newest first)
         """
@@ -478,7 +632,7 @@ class JobService:
             Job.profile_id == profile_id,
             BulletPoint.deleted_at.isnot(None),
             BulletPoint.deleted_at >= cutoff_date
-        ).order_by(BulletPoint.deleted_at.desc()).all()
+        ).options(contains_eager(BulletPoint.job)).order_by(BulletPoint.deleted_at.desc()).all()
 
     def restore_job(self, job_id: int) -> Job:
         """
@@ -145,7 +145,7 @@ Return ONLY the JSON object, nothing else."""
                 self.spacy_available = False
 
         # Initialize AI service
-        self.settings = Settings()
+        self.settings = Settings.instance()
         self.api_key = api_key or self.settings.get_api_key()
         self.ai_service_enabled = bool(self.api_key) and self.settings.get('ai_enhancement_enabled', True)
 
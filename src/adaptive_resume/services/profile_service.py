@@ -8,7 +8,7 @@ Note: Desktop app enforces single-profile design. Only one profile (id=1)
 is allowed per database. Multi-user support is planned for web version.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from adaptive_resume.models import Profile
@@ -63,10 +63,30 @@ class ProfileService:
         """
         Get the default (singleton) profile.
 
+        Looked up by primary key, so a profile already loaded in the session
+        is returned without a query until that session is expired. Commits on
+        this session do that; writers using another session must expire it
+        themselves (MainWindow does so when its background workers finish).
+
         Returns:
             Profile or None: The default profile (id=1) if it exists, None otherwise
         """
-        return self.session.query(Profile).filter_by(id=DEFAULT_PROFILE_ID).first()
+        return self.session.get(Profile, DEFAULT_PROFILE_ID)
+
+    def get_default_profile_name(self) -> Optional[Tuple[str, str]]:
+        """
+        Get the first and last name of the default profile.
+
+        Only the two name columns are selected, so no Profile instance is
+        built for callers that just need to show the name.
+
+        Returns:
+            Tuple of (first_name, last_name), or None if no profile exists
+        """
+        row = self.session.query(Profile.first_name, Profile.last_name).filter(
+            Profile.id == DEFAULT_PROFILE_ID
+        ).first()
+        return tuple(row) if row is not None else None
 
     def ensure_profile_exists(self) -> Profile:
         """
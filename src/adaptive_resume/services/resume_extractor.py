@@ -102,7 +102,7 @@ class ResumeExtractor:
         Args:
             settings: Application settings (for AI configuration)
         """
-        self.settings = settings or Settings()
+        self.settings = settings or Settings.instance()
 
         # Load spaCy model
         try:
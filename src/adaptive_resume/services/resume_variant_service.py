@@ -8,7 +8,7 @@ versions of tailored resumes for the same job posting.
 import json
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func
 
 from adaptive_resume.models.tailored_resume import TailoredResumeModel
 
@@ -113,6 +113,10 @@ class ResumeVariantService:
         """
         Get all variants for a job posting, ordered by variant number.
 
+        Rows are fully loaded by this one query; the fields shown in the
+        variants table (including the ``formatted_*`` properties) are plain
+        columns and need no relationship loads.
+
         Args:
             job_posting_id: ID of the job posting
 
@@ -231,13 +235,13 @@ class ResumeVariantService:
         if not variant:
             raise ValueError(f"Variant with ID {variant_id} not found")
 
-        # Unmark all other variants for this job as primary
+        # Set this variant as primary and unmark the others in one UPDATE
         self.session.query(TailoredResumeModel).filter_by(
             job_posting_id=variant.job_posting_id
-        ).update({"is_primary": False})
-
-        # Mark this variant as primary
-        variant.is_primary = True
+        ).update(
+            {"is_primary": case((TailoredResumeModel.id == variant_id, True), else_=False)},
+            synchronize_session="fetch"
+        )
         self.session.commit()
 
     def track_performance(
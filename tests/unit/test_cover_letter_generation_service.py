@@ -24,7 +24,7 @@ class TestCoverLetterGenerationService:
         with patch('adaptive_resume.services.cover_letter_generation_service.Settings') as mock_settings:
             mock_settings_instance = Mock()
             mock_settings_instance.get_api_key.return_value = "test-api-key"
-            mock_settings.return_value = mock_settings_instance
+            mock_settings.instance.return_value = mock_settings_instance
 
             service = CoverLetterGenerationService(session)
             return service
@@ -35,7 +35,7 @@ class TestCoverLetterGenerationService:
         with patch('adaptive_resume.services.cover_letter_generation_service.Settings') as mock_settings:
             mock_settings_instance = Mock()
             mock_settings_instance.get_api_key.return_value = None
-            mock_settings.return_value = mock_settings_instance
+            mock_settings.instance.return_value = mock_settings_instance
 
             service = CoverLetterGenerationService(session)
             return service
@@ -666,7 +666,7 @@ class TestCoverLetterGenerationService:
             with patch('adaptive_resume.services.cover_letter_generation_service.Anthropic') as mock_anthropic:
                 mock_settings_instance = Mock()
                 mock_settings_instance.get_api_key.return_value = "test-api-key"
-                mock_settings.return_value = mock_settings_instance
+                mock_settings.instance.return_value = mock_settings_instance
 
                 service = CoverLetterGenerationService(session)
 
@@ -679,7 +679,7 @@ class TestCoverLetterGenerationService:
         with patch('adaptive_resume.services.cover_letter_generation_service.Settings') as mock_settings:
             mock_settings_instance = Mock()
             mock_settings_instance.get_api_key.return_value = None
-            mock_settings.return_value = mock_settings_instance
+            mock_settings.instance.return_value = mock_settings_instance
 
             service = CoverLetterGenerationService(session)
 
@@ -50,3 +50,133 @@ def test_job_dialog_returns_data(qapp):
     assert result.start_date.year == 2020
     assert result.bullets
     dialog.close()
+
+
+def test_check_list_model_tracks_check_state(qapp):
+    from PyQt6.QtCore import Qt
+    from adaptive_resume.gui.dialogs.resume_preview_dialog import CheckListModel
+
+    model = CheckListModel(["Python", "SQL", "Leadership"], str)
+    changes = []
+    model.dataChanged.connect(lambda *args: changes.append(args))
+
+    model.set_all_checked(True)
+    assert changes == []
+
+    model.setData(model.index(1), Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
+    assert model.checked == [True, False, True]
+    assert model.data(model.index(1), Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+
+    model.set_all_checked(False)
+    assert model.checked == [False, False, False]
+    assert len(changes) == 2
+
+
+def test_skill_dialog_builds_autocomplete_on_first_edit(qapp):
+    from adaptive_resume.gui.dialogs import SkillDialog
+
+    dialog = SkillDialog(skill={"skill_name": "Pyth", "category": "Databases"})
+    assert dialog.skill_name_autocomplete is None
+    assert dialog._skill_db_service is None
+
+    dialog.skill_name.setText("Pytho")
+    dialog.skill_name.textEdited.emit("Pytho")
+
+    assert dialog.skill_name_autocomplete is not None
+    assert dialog.skill_name_autocomplete.text() == "Pytho"
+    assert dialog.skill_name is None
+    assert dialog.get_result().skill_name == "Pytho"
+    assert dialog.get_result().category == "Databases"
+    dialog.close()
+
+
+def test_import_worker_uses_own_session_and_emits_plain_data(qapp, session):
+    from adaptive_resume.gui.dialogs.resume_preview_dialog import ImportWorker
+    from adaptive_resume.models import Profile
+    from adaptive_resume.services.resume_extractor import ExtractedResume
+
+    extracted = ExtractedResume(first_name="Jane", last_name="Doe", email="jane@example.com")
+    worker = ImportWorker(extracted, None, session.get_bind())
+    results = []
+    worker.finished.connect(lambda *args: results.append(args))
+
+    worker.run()
+
+    assert len(results) == 1
+    profile_id, profile_name, stats = results[0]
+    assert profile_name == "Jane Doe"
+    assert session.get(Profile, profile_id).email == "jane@example.com"
+    assert isinstance(stats, dict)
+
+
+def test_settings_dialog_shows_saved_summary_before_closing(qapp, tmp_path, monkeypatch):
+    from PyQt6.QtTest import QTest
+    from PyQt6.QtWidgets import QDialog
+
+    import adaptive_resume.config.settings as settings_module
+    from adaptive_resume.config.settings import Settings
+    from adaptive_resume.gui.dialogs import SettingsDialog
+    from adaptive_resume.utils.encryption import EncryptionManager
+
+    monkeypatch.setattr(Settings, "SETTINGS_FILE", tmp_path / "settings.json")
+    monkeypatch.setattr(EncryptionManager, "KEY_FILE", tmp_path / ".key")
+    monkeypatch.setattr(settings_module, "_instance", None)
+
+    dialog = SettingsDialog()
+    dialog.ai_enabled_cb.setChecked(False)
+    dialog._on_save()
+
+    assert "Settings saved" in dialog.status_label.text()
+    assert "AI enhancement is disabled" in dialog.status_label.text()
+    assert not dialog.save_btn.isEnabled()
+    assert dialog.result() != QDialog.DialogCode.Accepted
+
+    QTest.qWait(1500)
+    assert dialog.result() == QDialog.DialogCode.Accepted
+    dialog.close()
+
+
+def test_resume_preview_sections_use_labelled_disclosure(qapp, monkeypatch):
+    from adaptive_resume.gui.dialogs.resume_preview_dialog import ResumePreviewDialog
+    from adaptive_resume.services.resume_extractor import ExtractedResume
+
+    monkeypatch.setattr(ResumePreviewDialog, "_prewarm_engine", lambda self: None)
+    extracted = ExtractedResume(first_name="Jane", last_name="Doe", skills=["Python", "SQL"])
+    dialog = ResumePreviewDialog(extracted)
+
+    group = dialog._section_groups["skills"]
+    toggle = dialog._section_toggles["skills"]
+    assert not group.isCheckable()
+    assert toggle.text() == "All 2 items will be imported — expand to choose"
+    assert "skills" not in dialog._section_content
+
+    toggle.setChecked(True)
+    assert "skills" in dialog._section_content
+    assert toggle.text() == "Hide items"
+
+    toggle.setChecked(False)
+    assert "only checked items" in toggle.text()
+    dialog.close()
+
+
+def test_resume_preview_stays_open_while_import_runs(qapp, monkeypatch):
+    from adaptive_resume.gui.dialogs.resume_preview_dialog import ResumePreviewDialog
+    from adaptive_resume.services.resume_extractor import ExtractedResume
+
+    class RunningWorker:
+        running = True
+
+        def isRunning(self):
+            return self.running
+
+    monkeypatch.setattr(ResumePreviewDialog, "_prewarm_engine", lambda self: None)
+    dialog = ResumePreviewDialog(ExtractedResume(first_name="Jane", last_name="Doe"))
+    dialog.show()
+    dialog.import_worker = RunningWorker()
+
+    dialog.close()
+    assert dialog.isVisible()
+
+    dialog.import_worker.running = False
+    dialog.close()
+    assert not dialog.isVisible()
@@ -9,7 +9,7 @@ try:  # pragma: no cover - platform-dependent import guard
 except Exception as exc:  # pragma: no cover
     pytest.skip(f"PyQt6 GUI dependencies unavailable: {exc}", allow_module_level=True)
 
-from adaptive_resume.gui.main_window import MainWindow
+from adaptive_resume.gui.main_window import BulletUpdateWorker, MainWindow, _dumps
 from adaptive_resume.services.job_service import JobService
 from adaptive_resume.services.profile_service import ProfileService
 from adaptive_resume.models import Skill, Education
@@ -82,8 +82,262 @@ def test_main_window_loads_profile_data(qapp, session):
         # Smoke test: verify window can be instantiated with data
         assert window is not None
         assert "Adaptive Resume Generator" in window.windowTitle()
+        assert "Jane Doe" in window.windowTitle()
         # Verify the window has basic components
         assert hasattr(window, 'nav_menu')
         assert hasattr(window, 'stacked_widget')
     finally:
         window.close()
+
+
+@pytest.fixture
+def window(qapp, session):
+    """Provide a MainWindow over a profile named Jane Doe."""
+    profile_service = ProfileService(session)
+    profile_service.create_profile(first_name="Jane", last_name="Doe", email="jane@example.com")
+    window = MainWindow(profile_service, JobService(session))
+    yield window
+    window.close()
+
+
+def test_profile_changed_updates_window_title(window):
+    window._current_profile_name = ("John", "Smith")
+    window.profile_changed.emit()
+    assert "John Smith" in window.windowTitle()
+
+
+def test_status_bar_is_created_once(window):
+    assert window.statusBar() is window.status_bar
+
+
+def test_screens_are_built_on_first_visit(window):
+    assert list(window.screens) == ["dashboard"]
+
+    window._navigate_to("skills")
+    assert window.stacked_widget.currentWidget() is window.skills_screen
+    assert list(window.screens) == ["dashboard", "skills"]
+
+    assert window.companies_screen is window.screens["companies"]
+    assert window.jobs_view is window.companies_screen.get_jobs_view()
+
+
+def test_screen_registry_is_read_only(window):
+    with pytest.raises(TypeError):
+        window.screens["skills"] = window.dashboard_screen
+
+
+def test_screen_navigation_signals_switch_screens(window):
+    window.dashboard_screen.navigate_to_general.emit()
+    assert window.stacked_widget.currentWidget() is window.general_screen
+
+    window.results_screen.start_over_requested.emit()
+    assert window.stacked_widget.currentWidget() is window.upload_screen
+
+    window._navigate_to("review")
+    assert window.nav_menu.get_current_screen() == "review"
+
+
+def test_reselecting_visible_screen_skips_reload(window):
+    window._navigate_to("review")
+    refreshes = []
+    window.review_screen.on_screen_shown = lambda: refreshes.append("review")
+
+    window._navigate_to("review")
+    assert refreshes == []
+
+    window._force_refresh = True
+    window._navigate_to("review")
+    assert refreshes == ["review"]
+    assert window._force_refresh is False
+
+
+def test_every_screen_is_stacked_at_its_index(window):
+    for screen_id in window._screen_factories:
+        window._navigate_to(screen_id)
+
+    assert window.stacked_widget.count() == len(window._screen_factories)
+    for screen_id, index in window._screen_index.items():
+        assert window.stacked_widget.widget(index) is window.screens[screen_id]
+
+
+def test_bullet_update_worker_saves_content(qapp, session, sample_job):
+    job_service = JobService(session)
+    bullet = job_service.create_bullet_point(
+        job_id=sample_job.id,
+        content="Managed the quarterly release process.",
+    )
+
+    worker = BulletUpdateWorker(
+        session.get_bind(), bullet.id, "Cut release lead time by 30% by automating checks."
+    )
+    results = []
+    worker.finished.connect(results.append)
+    worker.run()
+
+    assert results == [sample_job.id]
+    session.expire(bullet)
+    assert bullet.content == "Cut release lead time by 30% by automating checks."
+
+
+
+def test_bullet_enhanced_expires_shared_session(qapp, session, sample_job, monkeypatch):
+    import adaptive_resume.gui.main_window as main_window_module
+    from sqlalchemy.orm import Session
+    from adaptive_resume.models import Job
+
+    monkeypatch.setattr(main_window_module.DatabaseManager, "get_session", classmethod(lambda cls: session))
+    job_service = JobService(session)
+    job_service.create_bullet_point(job_id=sample_job.id, content="Ran releases.")
+    window = MainWindow(ProfileService(session), job_service)
+    window._navigate_to("companies")
+    assert sample_job.job_title != "Staff Engineer"
+
+    # Another session commits, as a background worker does
+    other = Session(bind=session.get_bind())
+    other.get(Job, sample_job.id).job_title = "Staff Engineer"
+    other.commit()
+    other.close()
+
+    try:
+        window._on_bullet_enhanced(sample_job.id)
+        assert sample_job.job_title == "Staff Engineer"
+    finally:
+        window.close()
+
+def test_edit_profile_skips_save_when_unchanged(qapp, session, monkeypatch):
+    import adaptive_resume.gui.main_window as main_window_module
+    from adaptive_resume.gui.dialogs.profile_dialog import ProfileDialogResult
+
+    profile_service = ProfileService(session)
+    profile_service.create_profile(first_name="Jane", last_name="Doe", email="jane@example.com")
+    window = MainWindow(profile_service, JobService(session))
+
+    class AcceptingDialog:
+        def __init__(self, parent, profile):
+            self.profile = profile
+
+        def exec(self):
+            return 1
+
+        def get_result(self):
+            return ProfileDialogResult(**self.profile)
+
+    updates = []
+    emitted = []
+    monkeypatch.setattr(main_window_module, "ProfileDialog", AcceptingDialog)
+    monkeypatch.setattr(profile_service, "update_profile", lambda **kwargs: updates.append(kwargs))
+    window.profile_changed.connect(lambda: emitted.append(True))
+    try:
+        window._edit_profile()
+        assert updates == []
+        assert emitted == []
+    finally:
+        window.close()
+
+
+def test_refresh_current_screen_coalesces_bursts(qapp, session):
+    from PyQt6.QtTest import QTest
+
+    profile_service = ProfileService(session)
+    profile_service.create_profile(first_name="Jane", last_name="Doe", email="jane@example.com")
+    window = MainWindow(profile_service, JobService(session))
+
+    refreshes = []
+    window.dashboard_screen.on_screen_shown = lambda: refreshes.append("dashboard")
+    try:
+        for _ in range(3):
+            window._refresh_current_screen()
+        assert refreshes == []
+        QTest.qWait(200)
+        assert refreshes == ["dashboard"]
+    finally:
+        window.close()
+
+
+def test_dumps_short_circuits_empty_containers():
+    assert _dumps([]) == "[]"
+    assert _dumps({}) == "{}"
+    assert _dumps(None) == "null"
+    assert _dumps({"Python": True}) == '{"Python": true}'
+
+
+def test_import_resume_uses_ai_setting_read_at_startup(qapp, session, monkeypatch):
+    import adaptive_resume.gui.main_window as main_window_module
+
+    class StubSettings:
+        ai_enabled = True
+
+    monkeypatch.setattr(main_window_module.Settings, "instance", classmethod(lambda cls: StubSettings()))
+
+    created = []
+
+    class RejectingImportDialog:
+        def __init__(self, parent, use_ai):
+            created.append(use_ai)
+
+        def exec(self):
+            return 0
+
+    monkeypatch.setattr(main_window_module, "ResumeImportDialog", RejectingImportDialog)
+
+    profile_service = ProfileService(session)
+    profile_service.create_profile(first_name="Jane", last_name="Doe", email="jane@example.com")
+    window = MainWindow(profile_service, JobService(session))
+    try:
+        window._import_resume()
+        assert created == [True]
+    finally:
+        window.close()
+
+
+def test_import_resume_reloads_profile_committed_by_worker(qapp, session, monkeypatch):
+    from PyQt6.QtTest import QTest
+    import adaptive_resume.gui.main_window as main_window_module
+    from sqlalchemy.orm import Session
+    from adaptive_resume.models import Profile
+
+    monkeypatch.setattr(main_window_module.DatabaseManager, "get_session", classmethod(lambda cls: session))
+    profile_service = ProfileService(session)
+    profile_service.create_profile(first_name="Jane", last_name="Doe", email="jane@example.com")
+    window = MainWindow(profile_service, JobService(session))
+    # Held like a screen would, so the identity map keeps the loaded instance
+    profile = profile_service.get_default_profile()
+    assert profile.first_name == "Jane"
+
+    class AcceptingImportDialog:
+        def __init__(self, parent, use_ai):
+            pass
+
+        def exec(self):
+            return 1
+
+        def get_extracted_resume(self):
+            return object()
+
+    class CommittingPreviewDialog:
+        """Stands in for the preview dialog, committing as its import worker would."""
+
+        def __init__(self, extracted_resume, profile_id, parent):
+            self.profile_id = profile_id
+
+        def exec(self):
+            other = Session(bind=session.get_bind())
+            other.get(Profile, self.profile_id).first_name = "Janet"
+            other.commit()
+            other.close()
+            return 1
+
+    monkeypatch.setattr(main_window_module, "ResumeImportDialog", AcceptingImportDialog)
+    monkeypatch.setattr(main_window_module, "ResumePreviewDialog", CommittingPreviewDialog)
+    profile_loads = []
+    window._get_screen("profile").on_screen_shown = lambda: profile_loads.append(True)
+    try:
+        window._import_resume()
+        assert profile_service.get_default_profile().first_name == "Janet"
+        assert "Janet Doe" in window.windowTitle()
+
+        # Navigation loads the profile screen; the debounced refresh is dropped
+        QTest.qWait(200)
+        assert profile_loads == [True]
+    finally:
+        window.close()
@@ -157,6 +157,35 @@ class TestJobServiceRead:
         
         with pytest.raises(JobNotFoundError, match="not found"):
             service.get_job_by_id(99999)
+
+    def test_get_job_with_bullets(self, session, sample_job):
+        """Test retrieving a job with its active bullets in display order."""
+        service = JobService(session)
+        second = service.create_bullet_point(sample_job.id, "Mentored four junior engineers", display_order=2)
+        first = service.create_bullet_point(sample_job.id, "Migrated billing to PostgreSQL", display_order=1)
+        removed = service.create_bullet_point(sample_job.id, "Wrote the on-call runbook", display_order=3)
+        service.delete_bullet_point(removed.id)
+
+        job, bullets = service.get_job_with_bullets(sample_job.id)
+
+        assert job.id == sample_job.id
+        assert [b.id for b in bullets] == [first.id, second.id]
+
+        with pytest.raises(JobNotFoundError):
+            service.get_job_with_bullets(99999)
+
+    def test_get_bullet_contents_for_job(self, session, sample_job):
+        """Test retrieving only the text of a job's active bullets."""
+        service = JobService(session)
+        service.create_bullet_point(sample_job.id, "Mentored four junior engineers", display_order=2)
+        service.create_bullet_point(sample_job.id, "Migrated billing to PostgreSQL", display_order=1)
+        removed = service.create_bullet_point(sample_job.id, "Wrote the on-call runbook", display_order=3)
+        service.delete_bullet_point(removed.id)
+
+        assert service.get_bullet_contents_for_job(sample_job.id) == [
+            "Migrated billing to PostgreSQL",
+            "Mentored four junior engineers",
+        ]
     
     def test_get_jobs_for_profile(self, session, sample_profile):
         """Test retrieving all jobs for a profile."""
@@ -219,6 +248,42 @@ class TestJobServiceUpdate:
         with pytest.raises(JobNotFoundError):
             service.update_job(job_id=99999, company_name="Test")
 
+    def test_rename_company(self, session, sample_profile, sample_job):
+        """Test renaming a company updates all of its jobs."""
+        service = JobService(session)
+        second = service.create_job(
+            profile_id=sample_profile.id,
+            company_name="TechCorp",
+            job_title="Engineer",
+            location="Austin, TX",
+            start_date=date(2018, 1, 1),
+            end_date=date(2019, 12, 31)
+        )
+        other = service.create_job(
+            profile_id=sample_profile.id,
+            company_name="OtherCorp",
+            job_title="Analyst",
+            start_date=date(2016, 1, 1),
+            end_date=date(2017, 12, 31)
+        )
+
+        updated = service.rename_company("TechCorp", " NewCorp ", "")
+
+        # A blank location keeps each role's own location
+        assert updated == 2
+        assert service.get_job_by_id(sample_job.id).company_name == "NewCorp"
+        assert service.get_job_by_id(sample_job.id).location == "Atlanta, GA"
+        assert service.get_job_by_id(second.id).company_name == "NewCorp"
+        assert service.get_job_by_id(second.id).location == "Austin, TX"
+        assert service.get_job_by_id(other.id).company_name == "OtherCorp"
+
+        service.rename_company("NewCorp", "NewCorp", " Remote ")
+        for job_id in (sample_job.id, second.id):
+            assert service.get_job_by_id(job_id).location == "Remote"
+
+        with pytest.raises(JobValidationError):
+            service.rename_company("NewCorp", "  ", None)
+
 
 class TestJobServiceDelete:
     """Test suite for job deletion."""
@@ -244,6 +309,28 @@ class TestJobServiceDelete:
             service.get_bullet_point_by_id(bullet_id)
 
 
+    def test_delete_jobs_bulk(self, session, sample_profile, sample_job, sample_bullet_point):
+        """Test bulk deleting jobs soft deletes them and their bullets."""
+        service = JobService(session)
+        other = service.create_job(
+            profile_id=sample_profile.id,
+            company_name="OtherCorp",
+            job_title="Analyst",
+            start_date=date(2018, 1, 1)
+        )
+
+        service.delete_jobs_bulk([sample_job.id])
+
+        with pytest.raises(JobNotFoundError):
+            service.get_job_by_id(sample_job.id)
+        bullet = service.get_bullet_point_by_id(sample_bullet_point.id, include_deleted=True)
+        assert bullet.deleted_at is not None
+        assert service.get_job_by_id(other.id).deleted_at is None
+
+        restored = service.restore_job(sample_job.id)
+        assert restored.deleted_at is None
+
+
 class TestBulletPointServiceCreate:
     """Test suite for bullet point creation."""
     
@@ -383,6 +470,44 @@ class TestBulletPointServiceDelete:
         with pytest.raises(BulletPointNotFoundError):
             service.get_bullet_point_by_id(bullet_id)
 
+    def test_replace_bullet_points(self, session, sample_job, sample_bullet_point):
+        """Test replacing a job's bullets soft deletes the old ones."""
+        service = JobService(session)
+        old_id = sample_bullet_point.id
+
+        service.replace_bullet_points(
+            sample_job.id,
+            ["  Shipped the new billing platform  ", "too short", "Cut deploy time by 40%"]
+        )
+
+        bullets = service.get_bullet_points_for_job(sample_job.id)
+        assert [b.content for b in bullets] == [
+            "Shipped the new billing platform",
+            "Cut deploy time by 40%",
+        ]
+        assert [b.display_order for b in bullets] == [1, 3]
+        assert service.get_bullet_point_by_id(old_id, include_deleted=True).deleted_at is not None
+
+    def test_replace_bullet_points_too_long(self, session, sample_job, sample_bullet_point):
+        """Test that an over-long bullet leaves existing bullets untouched."""
+        service = JobService(session)
+
+        with pytest.raises(BulletPointValidationError):
+            service.replace_bullet_points(sample_job.id, ["x" * 1001])
+
+        assert service.get_bullet_point_by_id(sample_bullet_point.id).deleted_at is None
+
+    def test_recently_deleted_bullets_load_job(self, session, sample_profile, sample_bullet_point):
+        """Test recently deleted bullets come back with their job loaded."""
+        service = JobService(session)
+        service.delete_bullet_point(sample_bullet_point.id)
+
+        bullets = service.get_recently_deleted_bullets(sample_profile.id)
+
+        assert [b.id for b in bullets] == [sample_bullet_point.id]
+        assert "job" in vars(bullets[0])
+        assert bullets[0].job.company_name == "TechCorp"
+
 
 class TestBulletPointTagManagement:
     """Test suite for tag management on bullet points."""
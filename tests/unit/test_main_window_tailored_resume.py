@@ -11,7 +11,7 @@ try:  # pragma: no cover - platform-dependent import guard
 except Exception as exc:  # pragma: no cover
     pytest.skip(f"PyQt6 GUI dependencies unavailable: {exc}", allow_module_level=True)
 
-from adaptive_resume.gui.main_window import MainWindow
+from adaptive_resume.gui.main_window import MainWindow, TailoredResumePersistWorker
 from adaptive_resume.services.resume_generator import TailoredResume
 from adaptive_resume.services.matching_engine import ScoredAccomplishment
 from adaptive_resume.models.job_posting import JobPosting
@@ -48,10 +48,15 @@ def main_window(qapp, session):
     mock_get_session = patcher.start()
     mock_get_session.return_value = session
 
+    # Save tailored resumes synchronously so results can be checked right away
+    worker_patcher = patch.object(TailoredResumePersistWorker, 'start', TailoredResumePersistWorker.run)
+    worker_patcher.start()
+
     window = MainWindow(profile_service, job_service)
 
     yield window
 
+    worker_patcher.stop()
     patcher.stop()
     window.close()
 
@@ -206,6 +206,7 @@ class TestProfileServiceRead:
         # At first, no profile should exist
         profile = service.get_default_profile()
         assert profile is None
+        assert service.get_default_profile_name() is None
 
         # ensure_profile_exists should create a profile if none exists
         profile = service.ensure_profile_exists()
@@ -219,11 +220,24 @@ class TestProfileServiceRead:
         # get_default_profile should now return the profile
         profile3 = service.get_default_profile()
         assert profile3.id == 1
+        assert service.get_default_profile_name() == ("", "")
 
         # Attempting to create a second profile should fail
         from adaptive_resume.services.profile_service import MultipleProfilesError
         with pytest.raises(MultipleProfilesError):
             service.create_profile("Second", "Profile", "second@example.com")
+
+    def test_get_default_profile_uses_identity_map(self, session, engine):
+        """Test that a loaded default profile is returned without a query."""
+        from sqlalchemy import event
+
+        service = ProfileService(session)
+        profile = service.ensure_profile_exists()
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        assert service.get_default_profile() is profile
+        assert statements == []
     
     def test_profile_exists(self, session, sample_profile):
         """Test checking if profile exists."""
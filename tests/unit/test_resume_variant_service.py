@@ -2,7 +2,7 @@
 
 import json
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from adaptive_resume.models.base import Base
@@ -165,6 +165,47 @@ class TestResumeVariantService:
 
         assert len(variants) == 0
 
+    def test_list_variants_single_query(self, session, base_resume):
+        """Test that listing variants and reading table fields issues one query."""
+        service = ResumeVariantService(session)
+        service.create_variant(base_resume.id, "Technical")
+        service.create_variant(base_resume.id, "Conservative")
+        job_posting_id = base_resume.job_posting_id
+        session.expire_all()
+
+        statements = []
+        engine = session.get_bind()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            variants = service.list_variants(job_posting_id)
+            for variant in variants:
+                (
+                    variant.variant_name,
+                    variant.formatted_created_at,
+                    variant.formatted_match_score,
+                    variant.formatted_coverage,
+                    variant.is_primary,
+                    variant.notes,
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(variants) == 3
+        assert len(statements) == 1
+
+    def test_formatted_created_at(self, session, base_resume):
+        """Test that the creation timestamp is formatted for display."""
+        service = ResumeVariantService(session)
+        variant = service.create_variant(base_resume.id, "Technical")
+
+        expected = variant.created_at.strftime("%Y-%m-%d %H:%M")
+        assert variant.formatted_created_at == expected
+        assert TailoredResumeModel().formatted_created_at == "N/A"
+
     def test_compare_variants(self, session, base_resume):
         """Test comparing multiple variants."""
         service = ResumeVariantService(session)
@@ -291,6 +332,28 @@ class TestResumeVariantService:
         assert base_resume.is_primary is False
         assert variant.is_primary is True
 
+    def test_mark_as_primary_single_update(self, session, base_resume):
+        """Test that switching the primary variant issues one UPDATE."""
+        service = ResumeVariantService(session)
+        variant = service.create_variant(base_resume.id, "Technical")
+
+        statements = []
+        engine = session.get_bind()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            service.mark_as_primary(variant.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+        assert len(updates) == 1
+        assert variant.is_primary is True
+        assert base_resume.is_primary is False
+
     def test_mark_as_primary_invalid_id(self, session):
         """Test marking nonexistent variant as primary raises error."""
         service = ResumeVariantService(session)
@@ -0,0 +1,63 @@
+"""Unit tests for the Settings manager."""
+
+import pytest
+
+from adaptive_resume.config.settings import Settings
+from adaptive_resume.utils.encryption import EncryptionManager
+
+
+@pytest.fixture
+def settings_paths(tmp_path, monkeypatch):
+    """Point settings and key files at a temporary directory."""
+    settings_file = tmp_path / "settings.json"
+    key_file = tmp_path / ".key"
+    monkeypatch.setattr(Settings, "SETTINGS_FILE", settings_file)
+    monkeypatch.setattr(EncryptionManager, "KEY_FILE", key_file)
+    return settings_file, key_file
+
+
+def test_settings_defers_encryption_until_key_used(settings_paths):
+    """Test that reading settings does not create the encryption key."""
+    _, key_file = settings_paths
+
+    settings = Settings()
+    assert settings.ai_enabled is False
+    assert settings.has_api_key() is False
+    assert not key_file.exists()
+
+    settings.set_api_key("sk-ant-test-key")
+    assert key_file.exists()
+    assert Settings().get_api_key() == "sk-ant-test-key"
+
+
+def test_settings_instance_is_shared_and_reloadable(settings_paths, monkeypatch):
+    """Test that Settings.instance() reuses one instance until reloaded."""
+    import adaptive_resume.config.settings as settings_module
+
+    monkeypatch.setattr(settings_module, "_instance", None)
+
+    shared = Settings.instance()
+    assert Settings.instance() is shared
+
+    other = Settings()
+    other.set('theme', 'light')
+    other.save()
+    assert shared.get('theme') == 'dark_blue'
+
+    shared.reload()
+    assert shared.get('theme') == 'light'
+
+
+def test_services_share_the_settings_instance(settings_paths, monkeypatch):
+    """Test that a key saved on the shared instance reaches services created later."""
+    import adaptive_resume.config.settings as settings_module
+    from adaptive_resume.services.ai_enhancement_service import AIEnhancementService
+
+    monkeypatch.setattr(settings_module, "_instance", None)
+
+    assert AIEnhancementService().enabled is False
+    Settings.instance().set_api_key("sk-ant-test-key")
+
+    service = AIEnhancementService()
+    assert service.settings is Settings.instance()
+    assert service.api_key == "sk-ant-test-key"